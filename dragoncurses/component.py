@@ -1,3 +1,4 @@
+from itertools import groupby
 from threading import Lock
 from typing import (
     Any,
@@ -30,6 +31,9 @@ class ComponentException(Exception):
 DeferredInput = Callable[[], bool]
 SettingT = TypeVar("SettingT")
 
+# Stands in for a missing key, since None can be a legitimately stored value.
+_MISSING: Any = object()
+
 
 class Component:
     def __init__(self) -> None:
@@ -65,7 +69,7 @@ class Component:
 
     def unregister(self, component: "Component") -> None:
         self.scene.unregister_component(component)
-        self.__children = [c for c in self.__children if id(c) != id(component)]
+        self.__children = [c for c in self.__children if c is not component]
 
     @property
     def dirty(self) -> bool:
@@ -139,11 +143,11 @@ class Component:
         expected_type: Type["SettingT"],
         default: Optional["SettingT"] = None,
     ) -> "SettingT":
-        if name not in self.settings:
+        setting = self.settings.get(name, _MISSING)
+        if setting is _MISSING:
             if default is not None:
                 return default
             raise Exception("Invalid setting {}".format(name))
-        setting = self.settings[name]
         if not isinstance(setting, expected_type):
             raise Exception("Invalid setting {}".format(name))
         return setting
@@ -151,16 +155,15 @@ class Component:
     def get_optional_setting(
         self, name: str, expected_type: Type["SettingT"]
     ) -> Optional["SettingT"]:
-        if name not in self.settings:
+        setting = self.settings.get(name, _MISSING)
+        if setting is _MISSING:
             return None
-        setting = self.settings[name]
         if not isinstance(setting, expected_type):
             raise Exception("Invalid setting {}".format(name))
         return setting
 
     def del_setting(self, name: str) -> None:
-        if name in self.settings:
-            del self.settings[name]
+        self.settings.pop(name, None)
 
     def __repr__(self) -> str:
         return "{}()".format(self.__class__.__name__)
@@ -235,13 +238,15 @@ class LabelComponent(Component):
             self.__rendered = True
             return
 
+        contextbounds = context.bounds
         if self.__invert or (self.__backcolor != Color.NONE):
             # Fill the entire label so that it is fully inverted
-            for line in range(context.bounds.height):
+            fill = " " * contextbounds.width
+            for line in range(contextbounds.height):
                 context.draw_string(
                     line,
                     0,
-                    " " * context.bounds.width,
+                    fill,
                     forecolor=self.__forecolor,
                     backcolor=self.__backcolor,
                     invert=True,
@@ -428,10 +433,12 @@ class ButtonComponent(HotkeyableComponent, ClickableComponent, Component):
         bordercolor: Optional[Color] = None,
         invert: bool = False,
         formatted: bool = False,
-        centered: bool = False
+        centered: bool = False,
+        on_click: Optional[Callable[[Component, Buttons], bool]] = None,
+        hotkey: Optional[str] = None
     ) -> None:
         super().__init__()
-        text, hotkey = _text_to_hotkeys(text)
+        text, texthotkey = _text_to_hotkeys(text)
         self.__label = LabelComponent(
             text,
             textcolor=textcolor,
@@ -446,8 +453,12 @@ class ButtonComponent(HotkeyableComponent, ClickableComponent, Component):
             else BorderComponent.ASCII,
             bordercolor=bordercolor,
         )
+        # An explicitly requested hotkey wins over one marked in the text.
+        hotkey = hotkey or texthotkey
         if hotkey:
             self.set_hotkey(hotkey)
+        if on_click is not None:
+            self.on_click(on_click)
 
     def render(self, context: RenderContext) -> None:
         self.__border._render(context, context.bounds)
@@ -574,11 +585,12 @@ class BorderComponent(Component):
 
         context.clear()
 
-        for x in range(context.bounds.width):
+        contextbounds = context.bounds
+        for x in range(contextbounds.width):
             if self.__style == BorderComponent.SOLID:
                 context.draw_string(0, x, " ", invert=True, forecolor=self.__color)
                 context.draw_string(
-                    context.bounds.height - 1,
+                    contextbounds.height - 1,
                     x,
                     " ",
                     invert=True,
@@ -587,27 +599,27 @@ class BorderComponent(Component):
             elif self.__style == BorderComponent.ASCII:
                 context.draw_string(0, x, "-", forecolor=self.__color)
                 context.draw_string(
-                    context.bounds.height - 1, x, "-", forecolor=self.__color
+                    contextbounds.height - 1, x, "-", forecolor=self.__color
                 )
             elif self.__style == BorderComponent.SINGLE:
                 context.draw_string(0, x, "\u2500", forecolor=self.__color)
                 context.draw_string(
-                    context.bounds.height - 1, x, "\u2500", forecolor=self.__color
+                    contextbounds.height - 1, x, "\u2500", forecolor=self.__color
                 )
             elif self.__style == BorderComponent.DOUBLE:
                 context.draw_string(0, x, "\u2550", forecolor=self.__color)
                 context.draw_string(
-                    context.bounds.height - 1, x, "\u2550", forecolor=self.__color
+                    contextbounds.height - 1, x, "\u2550", forecolor=self.__color
                 )
             else:
                 raise ComponentException("Invalid border style {}".format(self.__style))
 
-        for y in range(1, context.bounds.height - 1):
+        for y in range(1, contextbounds.height - 1):
             if self.__style == BorderComponent.SOLID:
                 context.draw_string(y, 0, " ", invert=True, forecolor=self.__color)
                 context.draw_string(
                     y,
-                    context.bounds.width - 1,
+                    contextbounds.width - 1,
                     " ",
                     invert=True,
                     forecolor=self.__color,
@@ -615,72 +627,70 @@ class BorderComponent(Component):
             elif self.__style == BorderComponent.ASCII:
                 context.draw_string(y, 0, "|", forecolor=self.__color)
                 context.draw_string(
-                    y, context.bounds.width - 1, "|", forecolor=self.__color
+                    y, contextbounds.width - 1, "|", forecolor=self.__color
                 )
             elif self.__style == BorderComponent.SINGLE:
                 context.draw_string(y, 0, "\u2502", forecolor=self.__color)
                 context.draw_string(
-                    y, context.bounds.width - 1, "\u2502", forecolor=self.__color
+                    y, contextbounds.width - 1, "\u2502", forecolor=self.__color
                 )
             elif self.__style == BorderComponent.DOUBLE:
                 context.draw_string(y, 0, "\u2551", forecolor=self.__color)
                 context.draw_string(
-                    y, context.bounds.width - 1, "\u2551", forecolor=self.__color
+                    y, contextbounds.width - 1, "\u2551", forecolor=self.__color
                 )
             else:
                 raise ComponentException("Invalid border style {}".format(self.__style))
 
         if self.__style == BorderComponent.ASCII:
             context.draw_string(0, 0, "+", forecolor=self.__color)
+            context.draw_string(0, contextbounds.width - 1, "+", forecolor=self.__color)
             context.draw_string(
-                0, context.bounds.width - 1, "+", forecolor=self.__color
+                contextbounds.height - 1, 0, "+", forecolor=self.__color
             )
             context.draw_string(
-                context.bounds.height - 1, 0, "+", forecolor=self.__color
-            )
-            context.draw_string(
-                context.bounds.height - 1,
-                context.bounds.width - 1,
+                contextbounds.height - 1,
+                contextbounds.width - 1,
                 "+",
                 forecolor=self.__color,
             )
         elif self.__style == BorderComponent.SINGLE:
             context.draw_string(0, 0, "\u250C", forecolor=self.__color)
             context.draw_string(
-                0, context.bounds.width - 1, "\u2510", forecolor=self.__color
+                0, contextbounds.width - 1, "\u2510", forecolor=self.__color
             )
             context.draw_string(
-                context.bounds.height - 1, 0, "\u2514", forecolor=self.__color
+                contextbounds.height - 1, 0, "\u2514", forecolor=self.__color
             )
             context.draw_string(
-                context.bounds.height - 1,
-                context.bounds.width - 1,
+                contextbounds.height - 1,
+                contextbounds.width - 1,
                 "\u2518",
                 forecolor=self.__color,
             )
         elif self.__style == BorderComponent.DOUBLE:
             context.draw_string(0, 0, "\u2554", forecolor=self.__color)
             context.draw_string(
-                0, context.bounds.width - 1, "\u2557", forecolor=self.__color
+                0, contextbounds.width - 1, "\u2557", forecolor=self.__color
             )
             context.draw_string(
-                context.bounds.height - 1, 0, "\u255A", forecolor=self.__color
+                contextbounds.height - 1, 0, "\u255A", forecolor=self.__color
             )
             context.draw_string(
-                context.bounds.height - 1,
-                context.bounds.width - 1,
+                contextbounds.height - 1,
+                contextbounds.width - 1,
                 "\u255D",
                 forecolor=self.__color,
             )
 
-        if context.bounds.width > 2 and context.bounds.height > 2:
+        if contextbounds.width > 2 and contextbounds.height > 2:
             self.__component._render(
                 context,
                 BoundingRectangle(
-                    top=context.bounds.top + 1,
-                    bottom=context.bounds.bottom - 1,
-                    left=context.bounds.left + 1,
-                    right=context.bounds.right - 1,
+                    top=contextbounds.top + 1,
+                    bottom=contextbounds.bottom - 1,
+                    left=contextbounds.left + 1,
+                    right=contextbounds.right - 1,
                 ),
             )
 
@@ -728,6 +738,8 @@ class ListComponent(Component):
         self.__size = size
         self.__direction = direction
         self.__visible = True
+        self.__layout_key: Optional[Tuple[int, int, int, int, int]] = None
+        self.__layout: List[BoundingRectangle] = []
 
     @property
     def dirty(self) -> bool:
@@ -807,39 +819,60 @@ class ListComponent(Component):
         if not self.__components or not self.__visible:
             return
 
+        # Our children's bounds only depend on ours, which rarely change, so only
+        # lay them out again when we're given somewhere new to draw.
+        contextbounds = context.bounds
+        key = (
+            contextbounds.top,
+            contextbounds.bottom,
+            contextbounds.left,
+            contextbounds.right,
+            len(self.__components),
+        )
+        if key != self.__layout_key:
+            self.__layout = self.__get_layout(context, contextbounds)
+            self.__layout_key = key
+
+        for component, bounds in zip(self.__components, self.__layout):
+            component._render(context, bounds)
+
+    def __get_layout(
+        self, context: RenderContext, contextbounds: BoundingRectangle
+    ) -> List[BoundingRectangle]:
         size = self.__get_size(context)
         if size is None:
             raise Exception("Logic error!")
 
+        layout: List[BoundingRectangle] = []
         offset = 0
-        for component in self.__components:
+        for _ in self.__components:
             if self.__direction == self.DIRECTION_TOP_TO_BOTTOM:
-                if offset >= context.bounds.height:
+                if offset >= contextbounds.height:
                     break
 
-                componenttop = context.bounds.top + offset
-                componentbottom = context.bounds.top + offset + size
-                if componentbottom > context.bounds.bottom:
-                    componentbottom = context.bounds.bottom
+                componenttop = contextbounds.top + offset
+                componentbottom = contextbounds.top + offset + size
+                if componentbottom > contextbounds.bottom:
+                    componentbottom = contextbounds.bottom
 
                 bounds = BoundingRectangle(
                     top=componenttop,
                     bottom=componentbottom,
-                    left=context.bounds.left,
-                    right=context.bounds.right,
+                    left=contextbounds.left,
+                    right=contextbounds.right,
                 )
             elif self.__direction == self.DIRECTION_LEFT_TO_RIGHT:
-                if offset >= context.bounds.width:
+                if offset >= contextbounds.width:
                     break
 
-                componentleft = context.bounds.left + offset
-                componentright = context.bounds.left + offset + size
-                if componentright > context.bounds.right:
-                    componentright = context.bounds.right
+                componentleft = contextbounds.left + offset
+                componentright = contextbounds.left + offset + size
+                if componentright > contextbounds.right:
+                    componentright = contextbounds.right
 
                 bounds = BoundingRectangle(
-                    top=context.bounds.top,
-                    bottom=context.bounds.bottom,
+                    top=contextbounds.top,
+                    bottom=contextbounds.bottom,
                     left=componentleft,
                     right=componentright,
                 )
@@ -849,7 +882,8 @@ class ListComponent(Component):
                 )
 
             offset += size
-            component._render(context, bounds)
+            layout.append(bounds)
+        return layout
 
     def handle_input(self, event: "InputEvent") -> Union[bool, DeferredInput]:
         # First, try all the controls we manage, seeing if any of them
@@ -913,6 +947,8 @@ class StickyComponent(Component):
         self.__size = size
         self.__location = location
         self.__visible = True
+        self.__layout_key: Optional[Tuple[int, int, int, int]] = None
+        self.__layout: List[BoundingRectangle] = []
 
     @property
     def dirty(self) -> bool:
@@ -966,6 +1002,24 @@ class StickyComponent(Component):
         if not self.__visible:
             return
 
+        # Our children's bounds only depend on ours, which rarely change, so only
+        # lay them out again when we're given somewhere new to draw.
+        contextbounds = context.bounds
+        key = (
+            contextbounds.top,
+            contextbounds.bottom,
+            contextbounds.left,
+            contextbounds.right,
+        )
+        if key != self.__layout_key:
+            self.__layout = self.__get_layout(contextbounds)
+            self.__layout_key = key
+
+        for component, cbounds in zip(self.__components, self.__layout):
+            if cbounds.width > 0 and cbounds.height > 0:
+                component._render(context, cbounds)
+
+    def __get_layout(self, contextbounds: BoundingRectangle) -> List[BoundingRectangle]:
         size = self.__get_size()
 
         # Set up the bounds for the sticky component then the other component.
@@ -973,71 +1027,67 @@ class StickyComponent(Component):
         if self.__location == self.LOCATION_TOP:
             bounds = [
                 BoundingRectangle(
-                    top=context.bounds.top,
-                    bottom=context.bounds.top + size,
-                    left=context.bounds.left,
-                    right=context.bounds.right,
+                    top=contextbounds.top,
+                    bottom=contextbounds.top + size,
+                    left=contextbounds.left,
+                    right=contextbounds.right,
                 ),
                 BoundingRectangle(
-                    top=context.bounds.top + size,
-                    bottom=context.bounds.bottom,
-                    left=context.bounds.left,
-                    right=context.bounds.right,
+                    top=contextbounds.top + size,
+                    bottom=contextbounds.bottom,
+                    left=contextbounds.left,
+                    right=contextbounds.right,
                 ),
             ]
         elif self.__location == self.LOCATION_BOTTOM:
             bounds = [
                 BoundingRectangle(
-                    top=context.bounds.bottom - size,
-                    bottom=context.bounds.bottom,
-                    left=context.bounds.left,
-                    right=context.bounds.right,
+                    top=contextbounds.bottom - size,
+                    bottom=contextbounds.bottom,
+                    left=contextbounds.left,
+                    right=contextbounds.right,
                 ),
                 BoundingRectangle(
-                    top=context.bounds.top,
-                    bottom=context.bounds.bottom - size,
-                    left=context.bounds.left,
-                    right=context.bounds.right,
+                    top=contextbounds.top,
+                    bottom=contextbounds.bottom - size,
+                    left=contextbounds.left,
+                    right=contextbounds.right,
                 ),
             ]
         elif self.__location == self.LOCATION_LEFT:
             bounds = [
                 BoundingRectangle(
-                    top=context.bounds.top,
-                    bottom=context.bounds.bottom,
-                    left=context.bounds.left,
-                    right=context.bounds.left + size,
+                    top=contextbounds.top,
+                    bottom=contextbounds.bottom,
+                    left=contextbounds.left,
+                    right=contextbounds.left + size,
                 ),
                 BoundingRectangle(
-                    top=context.bounds.top,
-                    bottom=context.bounds.bottom,
-                    left=context.bounds.left + size,
-                    right=context.bounds.right,
+                    top=contextbounds.top,
+                    bottom=contextbounds.bottom,
+                    left=contextbounds.left + size,
+                    right=contextbounds.right,
                 ),
             ]
         elif self.__location == self.LOCATION_RIGHT:
             bounds = [
                 BoundingRectangle(
-                    top=context.bounds.top,
-                    bottom=context.bounds.bottom,
-                    left=context.bounds.right - size,
-                    right=context.bounds.right,
+                    top=contextbounds.top,
+                    bottom=contextbounds.bottom,
+                    left=contextbounds.right - size,
+                    right=contextbounds.right,
                 ),
                 BoundingRectangle(
-                    top=context.bounds.top,
-                    bottom=context.bounds.bottom,
-                    left=context.bounds.left,
-                    right=context.bounds.right - size,
+                    top=contextbounds.top,
+                    bottom=contextbounds.bottom,
+                    left=contextbounds.left,
+                    right=contextbounds.right - size,
                 ),
             ]
         else:
             raise ComponentException("Invalid location {}".format(self.__location))
 
-        for i in range(len(self.__components)):
-            component = self.__components[i]
-            cbounds = bounds[i]
-            if cbounds.width > 0 and cbounds.height > 0:
-                component._render(context, cbounds)
+        return bounds
 
     def handle_input(self, event: "InputEvent") -> Union[bool, DeferredInput]:
         # First, try all the controls we manage, seeing if any of them
@@ -1137,11 +1187,12 @@ class PaddingComponent(Component):
         self.__component.tick()
 
     def render(self, context: RenderContext) -> None:
+        contextbounds = context.bounds
         bounds = BoundingRectangle(
-            top=context.bounds.top + self.__toppad,
-            bottom=context.bounds.bottom - self.__bottompad,
-            left=context.bounds.left + self.__leftpad,
-            right=context.bounds.right - self.__rightpad,
+            top=contextbounds.top + self.__toppad,
+            bottom=contextbounds.bottom - self.__bottompad,
+            left=contextbounds.left + self.__leftpad,
+            right=contextbounds.right - self.__rightpad,
         )
 
         if bounds.width <= 0 or bounds.height <= 0:
@@ -1278,12 +1329,13 @@ class MenuEntryComponent(HotkeyableComponent, ClickableComponent, MenuComponent)
         self.__animation_spot = 0
 
     def render(self, context: RenderContext) -> None:
-        context.clear()
         invert = self.__animating and (self.__animation_spot & 1) != 0
+        contextbounds = context.bounds
         if invert:
             # Fill the entire label so that it is fully inverted
-            for line in range(context.bounds.height):
-                context.draw_string(line, 0, " " * context.bounds.width, invert=True)
+            fill = " " * contextbounds.width
+            for line in range(contextbounds.height):
+                context.draw_string(line, 0, fill, invert=True)
         else:
             context.clear()
         if invert:
@@ -1294,9 +1346,7 @@ class MenuEntryComponent(HotkeyableComponent, ClickableComponent, MenuComponent)
             post = ""
         context.draw_formatted_string(0, 0, pre + " " + self.__text + " " + post)
         if self.__expandable:
-            context.draw_formatted_string(
-                0, context.bounds.width - 2, pre + " >" + post
-            )
+            context.draw_formatted_string(0, contextbounds.width - 2, pre + " >" + post)
         self.__rendered = True
 
     @property
@@ -1565,6 +1615,29 @@ class PopoverMenuComponent(Component):
         )
 
 
+# Quadrant block glyphs, indexed by a 4-bit mask of which pixels in a 2x2 quad
+# are set. The top left pixel is the high bit, followed by the top right, bottom
+# left and bottom right pixels.
+_QUADRANT_GLYPHS: Tuple[str, ...] = (
+    " ",
+    "\u2597",
+    "\u2596",
+    "\u2584",
+    "\u259D",
+    "\u2590",
+    "\u259E",
+    "\u259F",
+    "\u2598",
+    "\u259A",
+    "\u258C",
+    "\u2599",
+    "\u2580",
+    "\u259C",
+    "\u259B",
+    "\u2588",
+)
+
+
 class MonochromePictureComponent(Component):
 
     SIZE_FULL = "SIZE_FULL"
@@ -1612,80 +1685,44 @@ class MonochromePictureComponent(Component):
 
     def render(self, context: RenderContext) -> None:
         if self.__size == self.SIZE_FULL:
+            width = context.bounds.width
             for row in range(self.__height):
-                for column in range(self.__width):
+                # Draw each run of identical pixels with a single string, stopping
+                # at our edge so that a run can't wrap onto the next row.
+                column = 0
+                for value, run in groupby(self.__data[row]):
+                    if column >= width:
+                        break
+                    length = min(len(list(run)), width - column)
                     if Settings.enable_unicode:
-                        char = "\u2588" if self.__data[row][column] else " "
+                        chars = ("\u2588" if value else " ") * length
                         invert = False
                     else:
-                        invert = self.__data[row][column]
-                        char = " "
+                        invert = value
+                        chars = " " * length
 
                     context.draw_string(
                         row,
                         column,
-                        char,
+                        chars,
                         invert=invert,
                         forecolor=self.__forecolor,
                         backcolor=self.__backcolor,
                     )
+                    column += length
 
         if self.__size == self.SIZE_HALF:
-            for row in range(int((self.__height + 1) / 2)):
-                for column in range(int((self.__width + 1) / 2)):
-                    # Grab a quad that represents what graphic to draw
-                    quad: List[bool] = (
-                        self.__data[row * 2][(column * 2) : ((column * 2) + 2)]
-                        + self.__data[(row * 2) + 1][(column * 2) : ((column * 2) + 2)]
-                    )
-                    quadstr: str = "".join("1" if v else "0" for v in quad)
-
-                    # Look it up
-                    if quadstr == "0000":
-                        char = " "
-                    elif quadstr == "0001":
-                        char = "\u2597"
-                    elif quadstr == "0010":
-                        char = "\u2596"
-                    elif quadstr == "0011":
-                        char = "\u2584"
-                    elif quadstr == "0100":
-                        char = "\u259D"
-                    elif quadstr == "0101":
-                        char = "\u2590"
-                    elif quadstr == "0110":
-                        char = "\u259E"
-                    elif quadstr == "0111":
-                        char = "\u259F"
-                    elif quadstr == "1000":
-                        char = "\u2598"
-                    elif quadstr == "1001":
-                        char = "\u259A"
-                    elif quadstr == "1010":
-                        char = "\u258C"
-                    elif quadstr == "1011":
-                        char = "\u2599"
-                    elif quadstr == "1100":
-                        char = "\u2580"
-                    elif quadstr == "1101":
-                        char = "\u259C"
-                    elif quadstr == "1110":
-                        char = "\u259B"
-                    elif quadstr == "1111":
-                        char = "\u2588"
-                    else:
-                        raise Exception(
-                            "Logic error, invalid quad '{}'!".format(quadstr)
-                        )
-
-                    # Render it
-                    context.draw_string(
-                        row,
-                        column,
-                        char,
-                        forecolor=self.__forecolor,
-                        backcolor=self.__backcolor,
-                    )
+            # Every glyph shares the same colors, so draw each row as one string,
+            # cut off at our edge so it can't wrap onto the next row.
+            width = context.bounds.width
+            for row, line in enumerate(self.__lines):
+                context.draw_string(
+                    row,
+                    0,
+                    line[:width],
+                    forecolor=self.__forecolor,
+                    backcolor=self.__backcolor,
+                )
 
         self.__rendered = True
 
@@ -1707,7 +1744,7 @@ class MonochromePictureComponent(Component):
         self.__width = max(len(p) for p in data)
 
         # Chunk our graphics data into groups of 2
-        self.__data = [[x for x in row] for row in data]
+        self.__data = [[bool(x) for x in row] for row in data]
 
         if self.__size == self.SIZE_HALF:
             # First, do the easy part of making sure the height is divisible by 2
@@ -1729,6 +1766,27 @@ class MonochromePictureComponent(Component):
                     *([False] * (desired_width - len(self.__data[i]))),
                 ]
 
+        if self.__size == self.SIZE_HALF:
+            # Pack each row into an integer with the leftmost pixel in the highest
+            # bit, so each pair of pixels is a shift and a mask away.
+            bits = [
+                sum(
+                    1 << (desired_width - 1 - x) for x, value in enumerate(row) if value
+                )
+                for row in self.__data
+            ]
+
+            # Each glyph's index is its top pair of pixels followed by its bottom pair.
+            self.__lines = [
+                "".join(
+                    _QUADRANT_GLYPHS[
+                        (((top >> shift) & 0b11) << 2) | ((bottom >> shift) & 0b11)
+                    ]
+                    for shift in range(desired_width - 2, -1, -2)
+                )
+                for top, bottom in zip(bits[0::2], bits[1::2])
+            ]
+
     @property
     def forecolor(self) -> Color:
         return self.__forecolor
@@ -1793,79 +1851,20 @@ class PictureComponent(Component):
             raise ComponentException("Invalid size {}".format(self.__size))
 
     def render(self, context: RenderContext) -> None:
-        if self.__size == self.SIZE_FULL:
-            for row in range(self.__height):
-                for column in range(self.__width):
-                    char = " "
-                    forecolor = Color.NONE
-                    backcolor = self.__data[row][column]
-
-                    context.draw_string(
-                        row, column, char, forecolor=forecolor, backcolor=backcolor
-                    )
-
-        if self.__size == self.SIZE_HALF:
-            for row in range(int((self.__height + 1) / 2)):
-                for column in range(int((self.__width + 1) / 2)):
-                    # Grab a quad that represents what graphic to draw
-                    quad = (
-                        self.__data[row * 2][(column * 2) : ((column * 2) + 2)]
-                        + self.__data[(row * 2) + 1][(column * 2) : ((column * 2) + 2)]
-                    )
-                    colors = [q for q in quad if q != Color.NONE]
-                    forecolor = colors[0] if len(colors) > 0 else Color.NONE
-                    backcolor = Color.NONE
-                    for color in colors:
-                        if color != forecolor:
-                            backcolor = color
-                            break
-
-                    quadstr = "".join("1" if v == forecolor else "0" for v in quad)
-                    if quadstr == "1111" and forecolor == backcolor:
-                        quadstr = "0000"
-
-                    # Look it up
-                    if quadstr == "0000":
-                        char = " "
-                    elif quadstr == "0001":
-                        char = "\u2597"
-                    elif quadstr == "0010":
-                        char = "\u2596"
-                    elif quadstr == "0011":
-                        char = "\u2584"
-                    elif quadstr == "0100":
-                        char = "\u259D"
-                    elif quadstr == "0101":
-                        char = "\u2590"
-                    elif quadstr == "0110":
-                        char = "\u259E"
-                    elif quadstr == "0111":
-                        char = "\u259F"
-                    elif quadstr == "1000":
-                        char = "\u2598"
-                    elif quadstr == "1001":
-                        char = "\u259A"
-                    elif quadstr == "1010":
-                        char = "\u258C"
-                    elif quadstr == "1011":
-                        char = "\u2599"
-                    elif quadstr == "1100":
-                        char = "\u2580"
-                    elif quadstr == "1101":
-                        char = "\u259C"
-                    elif quadstr == "1110":
-                        char = "\u259B"
-                    elif quadstr == "1111":
-                        char = "\u2588"
-                    else:
-                        raise Exception(
-                            "Logic error, invalid quad '{}'!".format(quadstr)
-                        )
-
-                    # Render it
-                    context.draw_string(
-                        row, column, char, forecolor=forecolor, backcolor=backcolor
-                    )
+        # Replay the runs worked out when our data was set, cutting them off at our
+        # edge so they can't wrap onto the next row.
+        width = context.bounds.width
+        for row, runs in enumerate(self.__runs):
+            for column, text, forecolor, backcolor in runs:
+                if column >= width:
+                    break
+                context.draw_string(
+                    row,
+                    column,
+                    text[: width - column],
+                    forecolor=forecolor,
+                    backcolor=backcolor,
+                )
 
         self.__rendered = True
 
@@ -1909,6 +1908,56 @@ class PictureComponent(Component):
                     *([Color.NONE] * (desired_width - len(self.__data[i]))),
                 ]
 
+        # Work out each row's runs of identically colored glyphs up front, since
+        # they only change when our data does.
+        self.__runs: List[List[Tuple[int, str, Color, Color]]] = []
+        if self.__size == self.SIZE_FULL:
+            for pixels in self.__data:
+                runs = []
+                column = 0
+                for backcolor, run in groupby(pixels):
+                    length = len(list(run))
+                    runs.append((column, " " * length, Color.NONE, backcolor))
+                    column += length
+                self.__runs.append(runs)
+
+        if self.__size == self.SIZE_HALF:
+            for top, bottom in zip(self.__data[0::2], self.__data[1::2]):
+                glyphs = []
+                for left in range(0, desired_width, 2):
+                    # Grab a quad that represents what graphic to draw
+                    quad = (top[left], top[left + 1], bottom[left], bottom[left + 1])
+                    colors = [q for q in quad if q != Color.NONE]
+                    forecolor = colors[0] if len(colors) > 0 else Color.NONE
+                    backcolor = Color.NONE
+                    for color in colors:
+                        if color != forecolor:
+                            backcolor = color
+                            break
+
+                    # Each pixel matching the foreground color contributes one bit
+                    # to the glyph index.
+                    mask = (
+                        ((quad[0] == forecolor) << 3)
+                        | ((quad[1] == forecolor) << 2)
+                        | ((quad[2] == forecolor) << 1)
+                        | (quad[3] == forecolor)
+                    )
+                    if mask == 0b1111 and forecolor == backcolor:
+                        mask = 0b0000
+                    glyphs.append((forecolor, backcolor, _QUADRANT_GLYPHS[mask]))
+
+                # Glyphs next to each other with the same colors draw as one string.
+                runs = []
+                column = 0
+                for (forecolor, backcolor), group in groupby(
+                    glyphs, key=lambda glyph: (glyph[0], glyph[1])
+                ):
+                    text = "".join(glyph[2] for glyph in group)
+                    runs.append((column, text, forecolor, backcolor))
+                    column += len(text)
+                self.__runs.append(runs)
+
 
 class TextInputComponent(Component):
     def __init__(
@@ -1936,8 +1985,9 @@ class TextInputComponent(Component):
 
     def render(self, context: RenderContext) -> None:
         text = self.__text
-        if len(text) < context.bounds.width:
-            text = text + " " * (context.bounds.width - len(text))
+        contextbounds = context.bounds
+        if len(text) < contextbounds.width:
+            text = text + " " * (contextbounds.width - len(text))
 
         if not self.__focused:
             context.draw_formatted_string(0, 0, "<underline>" + text + "</underline>")
@@ -2204,26 +2254,27 @@ class CenteredComponent(Component):
         self.__component.tick()
 
     def render(self, context: RenderContext) -> None:
-        if self.__width < context.bounds.width:
-            xpos = int((context.bounds.width - self.__width) / 2)
+        contextbounds = context.bounds
+        if self.__width < contextbounds.width:
+            xpos = int((contextbounds.width - self.__width) / 2)
             width = self.__width
         else:
             xpos = 0
-            width = context.bounds.width
+            width = contextbounds.width
 
-        if self.__height < context.bounds.height:
-            ypos = int((context.bounds.height - self.__height) / 2)
+        if self.__height < contextbounds.height:
+            ypos = int((contextbounds.height - self.__height) / 2)
             height = self.__height
         else:
             ypos = 0
-            height = context.bounds.height
+            height = contextbounds.height
 
         context.clear()
         bounds = BoundingRectangle(
-            top=context.bounds.top + ypos,
-            bottom=context.bounds.top + ypos + height,
-            left=context.bounds.left + xpos,
-            right=context.bounds.left + xpos + width,
+            top=contextbounds.top + ypos,
+            bottom=contextbounds.top + ypos + height,
+            left=contextbounds.left + xpos,
+            right=contextbounds.left + xpos + width,
         )
 
         if bounds.width <= 0 or bounds.height <= 0:
@@ -2319,15 +2370,17 @@ class TabComponent(Component):
         self.__drawn = True
         context.clear()
 
+        contextbounds = context.bounds
+
         # First, draw the tab buttons.
         for i, button in enumerate(self.__buttons):
             button._render(
                 context,
                 BoundingRectangle(
-                    top=context.bounds.top,
-                    bottom=context.bounds.top + 3,
-                    left=context.bounds.left + (22 * i),
-                    right=context.bounds.left + (22 * i) + 21,
+                    top=contextbounds.top,
+                    bottom=contextbounds.top + 3,
+                    left=contextbounds.left + (22 * i),
+                    right=contextbounds.left + (22 * i) + 21,
                 ),
             )
 
@@ -2335,9 +2388,9 @@ class TabComponent(Component):
         self.__borders[self.__selected]._render(
             context,
             BoundingRectangle(
-                top=context.bounds.top + 3,
-                bottom=context.bounds.bottom,
-                left=context.bounds.left,
-                right=context.bounds.right,
+                top=contextbounds.top + 3,
+                bottom=contextbounds.bottom,
+                left=contextbounds.left,
+                right=contextbounds.right,
             ),
         )
@@ -1,15 +1,29 @@
 import curses
+import re
+import sys
 from enum import Enum, auto
 
 from contextlib import contextmanager
+from functools import lru_cache
 from _curses import error as CursesError
-from typing import Any, Dict, Generator, Optional, List
+from typing import Any, Dict, Generator, Optional, List, Tuple
 
 
 CursesContext = Any
 
+# Splits a formatted string into tags and the text between them.
+_TAG_RE = re.compile(r"(<[^<>]*>)")
+
+# Escaped characters allowed in the text portion of a formatted string.
+_ENTITY_RE = re.compile(r"&(lt|gt|amp);")
+_ENTITIES: Dict[str, str] = {"lt": "<", "gt": ">", "amp": "&"}
+
 
 class BoundingRectangle:
+    # These are created for every bounds, location and clip lookup, so skip the
+    # per-instance dictionary.
+    __slots__ = ("top", "bottom", "left", "right")
+
     def __init__(self, *, top: int, bottom: int, left: int, right: int) -> None:
         self.top: int = top
         self.bottom: int = bottom
@@ -61,79 +75,215 @@ class Color(Enum):
     BLACK = auto()
 
 
+_CURSES_COLORS: Dict[Color, int] = {
+    Color.RED: curses.COLOR_RED,
+    Color.YELLOW: curses.COLOR_YELLOW,
+    Color.GREEN: curses.COLOR_GREEN,
+    Color.CYAN: curses.COLOR_CYAN,
+    Color.BLUE: curses.COLOR_BLUE,
+    Color.MAGENTA: curses.COLOR_MAGENTA,
+    Color.WHITE: curses.COLOR_WHITE,
+    Color.BLACK: curses.COLOR_BLACK,
+}
+
+
+@lru_cache(maxsize=1024)
+def _compute_wrap_points(
+    string: str, starty: int, startx: int, boundswidth: int
+) -> Tuple[int, ...]:
+    locations: List[int] = []
+    processed: int = 0
+    pos: int = 0
+    length = len(string)
+
+    while pos < length:
+        # If we've wrapped once we start at the beginning of the line. Otherwise, we
+        # start where the start of the string is.
+        width = boundswidth if locations else (boundswidth - starty)
+        remaining = length - pos
+        if remaining <= width:
+            # Base case where we have enough room to draw the rest of the string.
+            newline = string.find("\n", pos)
+            while newline >= 0:
+                locations.append(processed + (newline - pos) + 1)
+                newline = string.find("\n", newline + 1)
+            break
+
+        # Find the closest wrap point (either a space/control character or a dash).
+        # We constrain our search to things that could wrap in the next line, plus
+        # the single character after in case it is a wrap character. That way if we
+        # were about to wrap and the next character would have wrapped us, we don't
+        # print it as the first character on the next line.
+        end = pos + max(min(remaining, (width + 1)), 0)
+        last = 0
+
+        newline = string.find("\n", pos, end)
+        if newline >= 0:
+            # This is a manual wrap, set our location to one past it (we will
+            # rely on the fact that its still printable and let curses do whatever).
+            # Since we finish wrapping this chunk at this line, don't consider any
+            # further possibilities.
+            last = newline - pos + 1
+        else:
+            # We wrap at the end of the last space block that starts in range, so
+            # find the first non-space character after it.
+            spaceend = end
+            while True:
+                space = max(
+                    string.rfind(" ", pos, spaceend),
+                    string.rfind("\t", pos, spaceend),
+                )
+                if space < 0:
+                    break
+                after = space + 1
+                while after < length and string[after] in " \t":
+                    after += 1
+                if after < length:
+                    last = after - pos
+                    break
+
+                # This spacing is the end of the string, so it can't be a wrap
+                # point. Look for an earlier space block instead.
+                while space > pos and string[space - 1] in " \t":
+                    space -= 1
+                spaceend = space
+
+            # We wrap after the dash as long as there isn't another dash and the
+            # characters before and after it are alphanumeric (word-break detection).
+            # We also don't want to wrap if this would have been the character on the
+            # next line (this is unlike the whitespace wrapping above) so we check the
+            # width.
+            dash = string.rfind("-", pos + 1, max(pos + min(remaining - 1, width), 0))
+            while dash > last + pos - 1:
+                if string[dash - 1].isalnum() and string[dash + 1].isalnum():
+                    last = dash - pos + 1
+                    break
+                dash = string.rfind("-", pos + 1, dash)
+
+        if last:
+            locations.append(processed + last)
+            pos += last
+            processed += last
+        else:
+            # Didn't find anywhere to wrap, so we give up, wrap at the exact point of
+            # overflow.
+            locations.append(processed + width)
+            if width >= 0:
+                pos += width
+            else:
+                # Starting past the edge, keep only the tail like a slice would.
+                pos = max(length + width, pos)
+            processed += width
+
+    return tuple(locations)
+
+
+@lru_cache(maxsize=256)
+def _resolve_color_tag(tag: str) -> Tuple[Color, Color]:
+    # Color tags are a foreground color, optionally followed by a comma and a
+    # background color.
+    splitcolors = tag.split(",")
+    while len(splitcolors) < 2:
+        splitcolors.append(Color.NONE.name)
+
+    return (Color[splitcolors[0].upper()], Color[splitcolors[1].upper()])
+
+
+# Names of the keys that getch() returns as plain characters, indexed by code.
+_CHARACTERS: Tuple[str, ...] = tuple(chr(code) for code in range(256))
+
+
+@lru_cache(maxsize=None)
+def _get_key_name(code: int) -> str:
+    # Special keys are named the same way curses' own getkey() names them. Interning
+    # them means comparisons against the Keys constants are identity checks.
+    return sys.intern(curses.keyname(code).decode("utf-8"))
+
+
 class RenderContext:
 
-    __color_table: Dict[str, int] = {
-        Color.NONE.name: 0,
-    }
+    # Allocated curses color pair for every foreground/background combination,
+    # indexed by color value. Curses reserves color pair 0 for the terminal
+    # defaults, so 0 marks a combination that hasn't been allocated yet.
+    __color_table: List[int] = [0] * (len(Color) * len(Color))
+    __next_color: int = 1
+
+    # Final curses attribute values, cached since only a handful of distinct
+    # styles are ever drawn.
+    __color_pair_table: Dict[Tuple[Color, Color], int] = {}
+    __attribute_table: Dict[Tuple[Color, Color, bool, bool], int] = {}
 
     def __init__(self, curses_context: CursesContext, off_y: int = 0, off_x: int = 0):
         self.__curses_context = curses_context
+        # Bound once up front since drawing calls this thousands of times per frame.
+        self.__addstr = curses_context.addstr
         self.__off_y = off_y
         self.__off_x = off_x
+        self.__bounds: Optional[BoundingRectangle] = None
 
     def __get_color(self, forecolor: Color, backcolor: Color) -> int:
-        colorkey = forecolor.name + ":" + backcolor.name
-        if colorkey in self.__color_table:
-            return self.__color_table[colorkey]
+        colorindex = (forecolor.value - 1) * len(Color) + (backcolor.value - 1)
+        color = self.__color_table[colorindex]
+        if color:
+            return color
 
         # Figure out the next color slot
-        nextcolor = len(self.__color_table.keys())
+        nextcolor = RenderContext.__next_color
+        RenderContext.__next_color += 1
 
         # Figure out the curses color mapping
-        if forecolor == Color.RED:
-            forecurses = curses.COLOR_RED
-        elif forecolor == Color.YELLOW:
-            forecurses = curses.COLOR_YELLOW
-        elif forecolor == Color.GREEN:
-            forecurses = curses.COLOR_GREEN
-        elif forecolor == Color.CYAN:
-            forecurses = curses.COLOR_CYAN
-        elif forecolor == Color.BLUE:
-            forecurses = curses.COLOR_BLUE
-        elif forecolor == Color.MAGENTA:
-            forecurses = curses.COLOR_MAGENTA
-        elif forecolor == Color.WHITE:
-            forecurses = curses.COLOR_WHITE
-        elif forecolor == Color.BLACK:
-            forecurses = curses.COLOR_BLACK
-        else:
-            forecurses = -1
-
-        if backcolor == Color.RED:
-            backcurses = curses.COLOR_RED
-        elif backcolor == Color.YELLOW:
-            backcurses = curses.COLOR_YELLOW
-        elif backcolor == Color.GREEN:
-            backcurses = curses.COLOR_GREEN
-        elif backcolor == Color.CYAN:
-            backcurses = curses.COLOR_CYAN
-        elif backcolor == Color.BLUE:
-            backcurses = curses.COLOR_BLUE
-        elif backcolor == Color.MAGENTA:
-            backcurses = curses.COLOR_MAGENTA
-        elif backcolor == Color.WHITE:
-            backcurses = curses.COLOR_WHITE
-        elif backcolor == Color.BLACK:
-            backcurses = curses.COLOR_BLACK
-        else:
-            backcurses = -1
+        forecurses = _CURSES_COLORS.get(forecolor, -1)
+        backcurses = _CURSES_COLORS.get(backcolor, -1)
 
         # Map the color to the slot
         curses.init_pair(nextcolor, forecurses, backcurses)
-        self.__color_table[colorkey] = nextcolor
+        self.__color_table[colorindex] = nextcolor
 
         # Return the curses color mapping value
         return nextcolor
 
+    def __get_color_pair(self, forecolor: Color, backcolor: Color) -> int:
+        colorkey = (forecolor, backcolor)
+        if colorkey not in self.__color_pair_table:
+            self.__color_pair_table[colorkey] = curses.color_pair(
+                self.__get_color(forecolor, backcolor)
+            )
+        return self.__color_pair_table[colorkey]
+
+    def __get_attributes(
+        self, forecolor: Color, backcolor: Color, invert: bool, underline: bool
+    ) -> int:
+        attributekey = (forecolor, backcolor, invert, underline)
+        if attributekey not in self.__attribute_table:
+            attributes = self.__get_color_pair(forecolor, backcolor)
+            if invert:
+                attributes = attributes | curses.A_REVERSE
+            if underline:
+                attributes = attributes | curses.A_UNDERLINE
+            self.__attribute_table[attributekey] = attributes
+        return self.__attribute_table[attributekey]
+
     @property
     def bounds(self) -> BoundingRectangle:
-        height, width = self.__curses_context.getmaxyx()
-        return BoundingRectangle(top=0, bottom=height, left=0, right=width)
+        # Our size only changes when the terminal is resized, so only ask curses
+        # again after we've been invalidated.
+        if self.__bounds is None:
+            height, width = self.__curses_context.getmaxyx()
+            self.__bounds = BoundingRectangle(top=0, bottom=height, left=0, right=width)
+        return self.__bounds
+
+    def invalidate_bounds(self) -> None:
+        self.__bounds = None
 
     @property
     def location(self) -> BoundingRectangle:
-        return self.bounds.offset(self.__off_y, self.__off_x)
+        bounds = self.bounds
+        return BoundingRectangle(
+            top=self.__off_y,
+            bottom=self.__off_y + bounds.bottom,
+            left=self.__off_x,
+            right=self.__off_x + bounds.right,
+        )
 
     @contextmanager
     def clip(self, rect: BoundingRectangle) -> Generator["RenderContext", None, None]:
@@ -149,79 +299,6 @@ class RenderContext:
         except CursesError:
             pass
 
-    @staticmethod
-    def __get_wrap_points(
-        string: str, starty: int, startx: int, bounds: BoundingRectangle
-    ) -> List[int]:
-        locations: List[int] = []
-        processed: int = 0
-
-        while string:
-            # If we've wrapped once we start at the beginning of the line. Otherwise, we
-            # start where the start of the string is.
-            width = bounds.width if locations else (bounds.width - starty)
-            if len(string) <= width:
-                # Base case where we have enough room to draw the rest of the string.
-                for i in range(len(string)):
-                    if string[i] == "\n":
-                        locations.append(processed + i + 1)
-                break
-
-            # Find the closest wrap point (either a space/control character or a dash).
-            # We constrain our search to things that could wrap in the next line, plus
-            # the single character after in case it is a wrap character. That way if we
-            # were about to wrap and the next character would have wrapped us, we don't
-            # print it as the first character on the next line.
-            possibilities = []
-            i = 0
-            maxiter = min(len(string), (width + 1))
-            while i < maxiter:
-                if string[i] == "\n":
-                    # This is a manual wrap, set our location to one past it (we will
-                    # rely on the fact that its still printable and let curses do whatever).
-                    # Since we finish wrapping this chunk at this line, don't consider any
-                    # further possibilities.
-                    possibilities.append(i + 1)
-                    break
-                elif string[i] in [" ", "\t"]:
-                    # We wrap at the end of the space block, so find the first non-space
-                    # character and set that as the wrap point.
-                    for j in range(i, len(string)):
-                        if string[j] not in [" ", "\t"]:
-                            possibilities.append(j)
-                            i = j
-                            break
-                    else:
-                        # We didn't find anything, assume that spacing is the end of the string.
-                        break
-                elif string[i] == "-" and i < width:
-                    # We wrap after the dash as long as there isn't another dash and the
-                    # characters before and after it are alphanumeric (word-break detection).
-                    # We also don't want to wrap if this would have been the character on the
-                    # next line (this is unlike the whitespace wrapping above) so we check the
-                    # width.
-                    if i > 0 and i < (len(string) - 1):
-                        if string[i - 1].isalnum() and string[i + 1].isalnum():
-                            possibilities.append(i + 1)
-                    i += 1
-                else:
-                    # Regular character, don't care
-                    i += 1
-
-            if possibilities:
-                last = possibilities[-1]
-                locations.append(processed + last)
-                string = string[last:]
-                processed += last
-            else:
-                # Didn't find anywhere to wrap, so we give up, wrap at the exact point of
-                # overflow.
-                locations.append(processed + width)
-                string = string[width:]
-                processed += width
-
-        return locations
-
     def draw_string(
         self,
         y: int,
@@ -235,79 +312,130 @@ class RenderContext:
         wrap: bool = False,
         centered: bool = False,
     ) -> None:
-        attributes = curses.color_pair(self.__get_color(forecolor, backcolor))
-        if invert:
-            attributes = attributes | curses.A_REVERSE
-        if underline:
-            attributes = attributes | curses.A_UNDERLINE
+        attributes = self.__get_attributes(forecolor, backcolor, invert, underline)
+        # Only look up our width when we need it, since it is a curses call.
+        boundswidth = self.bounds.width if (wrap or centered) else 0
 
-        if wrap:
-            # Wrap points takes care of carriage returns, so neuter curses ability
-            # to react to them.
-            wrap_points = RenderContext.__get_wrap_points(string, y, x, self.bounds)
-            string = string.replace("\n", " ")
-        else:
-            wrap_points = []
+        if not wrap:
+            # Only a single line to display, so skip the chunking.
+            offset = 0
+            if centered and x == 0 and len(string) < boundswidth:
+                offset = int((boundswidth - len(string)) / 2)
+            try:
+                self.__addstr(y, x + offset, string, attributes)
+            except CursesError:
+                pass
+            return
+
+        # Wrap points takes care of carriage returns, so neuter curses ability
+        # to react to them.
+        wrap_points = list(_compute_wrap_points(string, y, x, boundswidth))
+        string = string.replace("\n", " ")
 
         # Make sure we process the last bit of the string by always having a hanging
         # wrap point.
         if not wrap_points or wrap_points[-1] != len(string):
             wrap_points.append(len(string))
-        last_pos = 0
 
-        # Display each chunk in the proper spot.
-        for wrap_point in wrap_points:
-            chunk = string[last_pos:wrap_point]
-            if x == 0:
-                chunklen = len(chunk)
+        # Lay out every chunk before drawing, calculating centering for each one.
+        chunks = [
+            string[start:end] for start, end in zip([0, *wrap_points], wrap_points)
+        ]
+        columns = [
+            int((boundswidth - len(chunk)) / 2)
+            if centered and len(chunk) < boundswidth
+            else 0
+            for chunk in chunks
+        ]
+        if x != 0:
+            # Disable centering for the first line if we start on a non-zero x
+            columns[0] = x
 
-                # Calculate centering for this chunk
-                offset = 0
-                if centered:
-                    if chunklen < self.bounds.width:
-                        offset = int((self.bounds.width - chunklen) / 2)
-            else:
-                # Disable centering for this line if we start on a non-zero x
-                offset = 0
-
-            # Display it!
+        # Display each chunk in the proper spot.
+        for chunk, column in zip(chunks, columns):
             try:
-                self.__curses_context.addstr(y, x + offset, chunk, attributes)
+                self.__addstr(y, column, chunk, attributes)
             except CursesError:
                 pass
-            last_pos = wrap_point
             y += 1
-            x = 0
 
     @staticmethod
-    def __split_formatted_string(string: str) -> List[str]:
-        accumulator: List[str] = []
-        parts: List[str] = []
-
-        for ch in string:
-            if ch == "<":
-                if accumulator:
-                    parts.append("".join(accumulator))
-                    accumulator = []
-                accumulator.append(ch)
-            elif ch == ">":
-                accumulator.append(ch)
-                if accumulator[0] == "<":
-                    parts.append("".join(accumulator))
-                    accumulator = []
-            else:
-                accumulator.append(ch)
-
-        if accumulator:
-            parts.append("".join(accumulator))
-        return parts
+    @lru_cache(maxsize=1024)
+    def __split_formatted_string(string: str) -> Tuple[str, ...]:
+        if "<" not in string:
+            # No tags at all, so the whole string is text.
+            return (string,) if string else ()
+        return tuple(part for part in _TAG_RE.split(string) if part)
 
     @staticmethod
+    @lru_cache(maxsize=1024)
     def __sanitize(string: str) -> str:
-        string = string.replace("&lt;", "<")
-        string = string.replace("&gt;", ">")
-        string = string.replace("&amp;", "&")
-        return string
+        if "&" not in string:
+            return string
+        return _ENTITY_RE.sub(lambda match: _ENTITIES[match.group(1)], string)
+
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def __get_raw_text(string: str) -> str:
+        if "<" not in string and "&" not in string:
+            # Nothing to strip or unescape, so the string is already raw text.
+            return string
+        return "".join(
+            RenderContext.__sanitize(part)
+            for part in RenderContext.__split_formatted_string(string)
+            if not (part[:1] == "<" and part[-1:] == ">")
+        )
+
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def __compile_formatted_string(
+        string: str,
+    ) -> Tuple[Tuple[bool, bool, Color, Color, str], ...]:
+        # Resolve the tags in a formatted string into runs of text, merging adjacent
+        # runs which end up with identical styles so they can be drawn at once.
+        invert = False
+        underline = False
+        colors = [(Color.NONE, Color.NONE)]
+        segments: List[Tuple[bool, bool, Color, Color, str]] = []
+
+        for part in RenderContext.__split_formatted_string(string):
+            if part[:2] == "</" and part[-1:] == ">":
+                # Close tag
+                tag = part[2:-1].lower()
+                if tag == "invert":
+                    invert = False
+                elif tag == "underline":
+                    underline = False
+                else:
+                    color = _resolve_color_tag(tag)
+                    if color == colors[-1] and len(colors) > 1:
+                        colors.pop()
+            elif part[:1] == "<" and part[-1:] == ">":
+                # Open tag
+                tag = part[1:-1].lower()
+                if tag == "invert":
+                    invert = True
+                elif tag == "underline":
+                    underline = True
+                else:
+                    colors.append(_resolve_color_tag(tag))
+            else:
+                text = RenderContext.__sanitize(part)
+                forecolor, backcolor = colors[-1]
+                style = (invert, underline, forecolor, backcolor)
+                if segments and segments[-1][:4] == style:
+                    text = segments.pop()[4] + text
+                segments.append((invert, underline, forecolor, backcolor, text))
+
+        return tuple(segments)
+
+    def __get_formatted_segments(self, string: str) -> List[Tuple[int, str]]:
+        return [
+            (self.__get_attributes(forecolor, backcolor, invert, underline), text)
+            for invert, underline, forecolor, backcolor, text in (
+                RenderContext.__compile_formatted_string(string)
+            )
+        ]
 
     def draw_formatted_string(
         self,
@@ -318,18 +446,15 @@ class RenderContext:
         wrap: bool = False,
         centered: bool = False,
     ) -> None:
-        attributes = 0
         last_pos = 0
         length_part = 0
-        colors = [self.__get_color(Color.NONE, Color.NONE)]
-        parts = RenderContext.__split_formatted_string(string)
-        rawtext = "".join(
-            RenderContext.__sanitize(part)
-            for part in parts
-            if not (part[:1] == "<" and part[-1:] == ">")
-        )
+        segments = self.__get_formatted_segments(string)
+        rawtext = RenderContext.__get_raw_text(string)
+        # Only look up our width when we need it, since it is a curses call.
+        boundswidth = self.bounds.width if (wrap or centered) else 0
+
         if wrap:
-            wrap_points = RenderContext.__get_wrap_points(rawtext, y, x, self.bounds)
+            wrap_points = list(_compute_wrap_points(rawtext, y, x, boundswidth))
             if wrap_points:
                 lengths = [
                     wrap_points[0] - x,
@@ -344,8 +469,8 @@ class RenderContext:
 
             # Only center first line if we're starting at the leftmost column.
             if centered and x == 0:
-                if lengths[length_part] < self.bounds.width:
-                    x += int((self.bounds.width - lengths[length_part]) / 2)
+                if lengths[length_part] < boundswidth:
+                    x += int((boundswidth - lengths[length_part]) / 2)
         else:
             wrap_points = []
             lengths = []
@@ -355,143 +480,94 @@ class RenderContext:
             if x == 0:
                 chunklen = len(rawtext)
                 if centered:
-                    if chunklen < self.bounds.width:
-                        offset = int((self.bounds.width - chunklen) / 2)
+                    if chunklen < boundswidth:
+                        offset = int((boundswidth - chunklen) / 2)
 
             self.__curses_context.move(y, x + offset)
 
-        for part in parts:
-            if part[:2] == "</" and part[-1:] == ">":
-                # Close tag
-                tag = part[2:-1].lower()
-                if tag == "invert":
-                    attributes = attributes & (~curses.A_REVERSE)
-                elif tag == "underline":
-                    attributes = attributes & (~curses.A_UNDERLINE)
-                else:
-                    splitcolors = tag.split(",")
-                    while len(splitcolors) < 2:
-                        splitcolors.append(Color.NONE.name)
-
-                    color = self.__get_color(
-                        Color[splitcolors[0].upper()], Color[splitcolors[1].upper()]
-                    )
-                    if color == colors[-1] and len(colors) > 1:
-                        colors = colors[:-1]
-            elif part[:1] == "<" and part[-1:] == ">":
-                # Open tag
-                tag = part[1:-1].lower()
-                if tag == "invert":
-                    attributes = attributes | curses.A_REVERSE
-                elif tag == "underline":
-                    attributes = attributes | curses.A_UNDERLINE
-                else:
-                    splitcolors = tag.split(",")
-                    while len(splitcolors) < 2:
-                        splitcolors.append(Color.NONE.name)
-
-                    colors.append(
-                        self.__get_color(
-                            Color[splitcolors[0].upper()], Color[splitcolors[1].upper()]
-                        )
-                    )
+        for attributes, text in segments:
+            # The rest of the text displays should trail, for wrapping
+            if wrap:
+                # Disable curses ability to react to carriage returns
+                text = text.replace("\n", " ")
+                while text:
+                    if not wrap_points:
+                        next_wrap_point = -1
+                    else:
+                        next_wrap_point = wrap_points[0] - last_pos
+                    if next_wrap_point >= 0 and next_wrap_point < len(text):
+                        # Only display part of the string, then go to next line
+                        amount = wrap_points[0] - last_pos
+                        wrap_points = wrap_points[1:]
+                        try:
+                            self.__addstr(y, x, text[:amount], attributes)
+                        except CursesError:
+                            pass
+                        text = text[amount:]
+                        last_pos += amount
+                        y += 1
+                        x = 0
+                        if centered:
+                            length_part += 1
+                            if (
+                                len(lengths) > length_part
+                                and lengths[length_part] < boundswidth
+                            ):
+                                x += int((boundswidth - lengths[length_part]) / 2)
+                    else:
+                        try:
+                            self.__addstr(y, x, text, attributes)
+                        except CursesError:
+                            pass
+                        x += len(text)
+                        last_pos += len(text)
+                        text = ""
             else:
-                # The rest of the text displays should trail, for wrapping
-                text = RenderContext.__sanitize(part)
-                if wrap:
-                    # Disable curses ability to react to carriage returns
-                    text = text.replace("\n", " ")
-                    while text:
-                        if not wrap_points:
-                            next_wrap_point = -1
-                        else:
-                            next_wrap_point = wrap_points[0] - last_pos
-                        if next_wrap_point >= 0 and next_wrap_point < len(text):
-                            # Only display part of the string, then go to next line
-                            amount = wrap_points[0] - last_pos
-                            wrap_points = wrap_points[1:]
-                            try:
-                                self.__curses_context.addstr(
-                                    y,
-                                    x,
-                                    text[:amount],
-                                    attributes | curses.color_pair(colors[-1]),
-                                )
-                            except CursesError:
-                                pass
-                            text = text[amount:]
-                            last_pos += amount
-                            y += 1
-                            x = 0
-                            if centered:
-                                length_part += 1
-                                if (
-                                    len(lengths) > length_part
-                                    and lengths[length_part] < self.bounds.width
-                                ):
-                                    x += int(
-                                        (self.bounds.width - lengths[length_part]) / 2
-                                    )
-                        else:
-                            try:
-                                self.__curses_context.addstr(
-                                    y,
-                                    x,
-                                    text,
-                                    attributes | curses.color_pair(colors[-1]),
-                                )
-                            except CursesError:
-                                pass
-                            x += len(text)
-                            last_pos += len(text)
-                            text = ""
-                else:
-                    try:
-                        self.__curses_context.addstr(
-                            text, attributes | curses.color_pair(colors[-1])
-                        )
-                    except CursesError:
-                        pass
+                try:
+                    self.__addstr(text, attributes)
+                except CursesError:
+                    pass
 
     @staticmethod
+    @lru_cache(maxsize=1024)
     def formatted_string_length(
         string: str,
     ) -> int:
         # TODO: This isn't a very good place for this, but its close to the draw function so I dunno.
-        length = 0
-        parts = RenderContext.__split_formatted_string(string)
-
-        for part in parts:
-            if part[:1] == "<" and part[-1:] == ">":
-                continue
-            else:
-                length += len(RenderContext.__sanitize(part))
-        return length
+        return len(RenderContext.__get_raw_text(string))
 
     def formatted_string_height(
         self,
         string: str,
     ) -> int:
         # TODO: This also isn't a very good place for this, but its close to the draw function as well.
-        parts = RenderContext.__split_formatted_string(string)
-        rawtext = "".join(
-            RenderContext.__sanitize(part)
-            for part in parts
-            if not (part[:1] == "<" and part[-1:] == ">")
-        )
+        return RenderContext.__get_formatted_height(string, self.bounds.width)
+
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def __get_formatted_height(string: str, boundswidth: int) -> int:
+        # Height only depends on the text and how wide we are, so cache it.
+        rawtext = RenderContext.__get_raw_text(string)
         if len(rawtext) == 0:
             return 0
-        wrap_points = RenderContext.__get_wrap_points(rawtext, 0, 0, self.bounds)
+        wrap_points = _compute_wrap_points(rawtext, 0, 0, boundswidth)
         return len(wrap_points) + 1
 
     def clear(self) -> None:
         self.__curses_context.clear()
 
     def refresh(self) -> None:
-        self.__curses_context.refresh()
+        # Stage our window and then flush everything staged in one terminal update,
+        # so any other windows that were staged go out with it.
+        self.__curses_context.noutrefresh()
+        curses.doupdate()
 
     def getkey(self) -> Optional[str]:
-        try:
-            return str(self.__curses_context.getkey())
-        except CursesError:
+        # Read the raw key code and look its name up ourselves, so that curses
+        # doesn't have to build a new string for every keypress.
+        code: int = self.__curses_context.getch()
+        if code < 0:
             return None
+        if code < 256:
+            return _CHARACTERS[code]
+        return _get_key_name(code)
@@ -31,10 +31,12 @@ class Directions(Enum):
 
 
 class InputEvent:
-    pass
+    __slots__ = ()
 
 
 class KeyboardInputEvent(InputEvent):
+    __slots__ = ("character",)
+
     def __init__(self, character: str) -> None:
         self.character = character
 
@@ -43,6 +45,8 @@ class KeyboardInputEvent(InputEvent):
 
 
 class MouseInputEvent(InputEvent):
+    __slots__ = ("x", "y", "button")
+
     def __init__(self, x: int, y: int, button: Buttons) -> None:
         self.x = x
         self.y = y
@@ -55,18 +59,25 @@ class MouseInputEvent(InputEvent):
 
 
 class ScrollInputEvent(InputEvent):
-    def __init__(self, x: int, y: int, direction: Directions) -> None:
+    __slots__ = ("x", "y", "direction", "count")
+
+    def __init__(self, x: int, y: int, direction: Directions, count: int = 1) -> None:
         self.x = x
         self.y = y
         self.direction = direction
+        # How many scroll notches arrived together and were merged into this event.
+        # This is always 1 unless the main loop was started with merge_scrolls.
+        self.count = count
 
     def __repr__(self) -> str:
-        return "ScrollInputEvent(x={}, y={}, direction={})".format(
-            self.x, self.y, self.direction.name
+        return "ScrollInputEvent(x={}, y={}, direction={}, count={})".format(
+            self.x, self.y, self.direction.name, self.count
         )
 
 
 class DefocusInputEvent(InputEvent):
+    __slots__ = ("button",)
+
     def __init__(self, button: Buttons) -> None:
         self.button = button
 
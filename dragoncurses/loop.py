@@ -1,11 +1,23 @@
 import curses
 import os
 import platform
+import sys
 import time
 
+from collections import deque
 from contextlib import contextmanager
 from _curses import error as CursesError
-from typing import Any, Callable, Dict, Generator, List, Optional, Tuple, Type
+from typing import (
+    Any,
+    Callable,
+    Deque,
+    Dict,
+    Generator,
+    List,
+    Optional,
+    Tuple,
+    Type,
+)
 
 from .context import BoundingRectangle, RenderContext
 from .component import Component, DeferredInput
@@ -22,6 +34,30 @@ from .scene import Scene
 
 CursesContext = Any
 
+# Some redraw optimizations don't seem to work on Windows.
+_ON_WINDOWS: bool = platform.system() == "Windows"
+
+# Special keys we handle ourselves instead of passing on as keyboard input.
+_KEY_RESIZE = sys.intern("KEY_RESIZE")
+_KEY_MOUSE = sys.intern("KEY_MOUSE")
+
+# Mouse event masks we care about, mapped to what they mean to us.
+_MOUSE_PRESSES: Dict[int, Buttons] = {
+    curses.BUTTON1_PRESSED: Buttons.LEFT,
+    curses.BUTTON2_PRESSED: Buttons.MIDDLE,
+    curses.BUTTON3_PRESSED: Buttons.RIGHT,
+}
+_MOUSE_RELEASES: Dict[int, Buttons] = {
+    curses.BUTTON1_RELEASED: Buttons.LEFT,
+    curses.BUTTON2_RELEASED: Buttons.MIDDLE,
+    curses.BUTTON3_RELEASED: Buttons.RIGHT,
+}
+_MOUSE_SCROLLS: Dict[int, Directions] = {
+    curses.BUTTON4_PRESSED: Directions.UP,
+    curses.REPORT_MOUSE_POSITION: Directions.DOWN,
+    0x200000: Directions.DOWN,
+}
+
 
 @contextmanager
 def loop_config(context: CursesContext) -> Generator[None, None, None]:
@@ -46,6 +82,7 @@ def execute(
     settings: Optional[Dict[str, Any]] = None,
     idle_callback: Optional[Callable[["MainLoop"], None]] = None,
     realtime: bool = False,
+    merge_scrolls: bool = False,
 ) -> None:
     os.environ.setdefault("ESCDELAY", "25")
     os.environ["ESCDELAY"] = "25"
@@ -58,6 +95,7 @@ def execute(
                 settings if settings is not None else {},
                 idle_callback,
                 realtime=realtime,
+                merge_scrolls=merge_scrolls,
             )
             loop.change_scene(start_scene)
             loop.run()
@@ -68,6 +106,9 @@ def execute(
 class MainLoop:
 
     TICK_DELTA = 1 / 12
+    FRAME_DELTA = 1 / 20
+    MAX_TICK_BACKLOG = 3
+    INPUT_TIMEOUT = 1 / 60
 
     class _ExitScene(Scene):
         pass
@@ -78,14 +119,20 @@ class MainLoop:
         settings: Dict[str, Any],
         idle_callback: Optional[Callable[["MainLoop"], None]] = None,
         realtime: bool = False,
+        merge_scrolls: bool = False,
     ) -> None:
         if not realtime and idle_callback:
             raise Exception("Cannot have idle callback without realtime mode!")
         if realtime:
-            context.nodelay(1)
+            # Wait a little while for input instead of spinning, coming back often
+            # enough to keep ticking and calling the idle callback.
+            context.timeout(int(self.INPUT_TIMEOUT * 1000))
         else:
             context.nodelay(0)
         self.context = RenderContext(context)
+        self.__curses_context = context
+        self.__realtime = realtime
+        self.__merge_scrolls = merge_scrolls
         self.settings = settings
         self.scene: Optional[Scene] = None
         self.components: List[Component] = []
@@ -96,6 +143,8 @@ class MainLoop:
         self.__dirty: bool = False
         self.__idle = idle_callback
         self.__last_tick: float = 0.0
+        self.__pending_events: Deque[InputEvent] = deque()
+        self.__deferred: List[DeferredInput] = []
         self.__mousestate: Dict[Buttons, Tuple[Tuple[int, int], float]] = {
             Buttons.LEFT: ((-1, -1), -1),
             Buttons.MIDDLE: ((-1, -1), -1),
@@ -124,19 +173,28 @@ class MainLoop:
             self.__dirty = True
 
     def unregister_component(self, component: Component) -> None:
-        found_components = [
-            c for c in self.registered_components if id(c[0]) == id(component)
-        ]
-        self.registered_components = [
-            c for c in self.registered_components if id(c[0]) != id(component)
-        ]
+        # Split the registrations in one pass instead of walking them twice.
+        found_components = []
+        kept_components = []
+        for entry in self.registered_components:
+            if entry[0] is component:
+                found_components.append(entry)
+            else:
+                kept_components.append(entry)
+        if not found_components:
+            return
+
+        self.registered_components = kept_components
         for (component, _, _) in found_components:
             component._detach()
             self.__dirty = True
 
     def run(self) -> None:
-        # Some redraw optimizations don't seem to work on Windows.
-        on_windows: bool = platform.system() == "Windows"
+        tick_delta = self.TICK_DELTA
+        max_ticks = self.MAX_TICK_BACKLOG
+        frame_delta = self.FRAME_DELTA
+        last_render = 0.0
+        handled_events = False
 
         while self.scene is not None or self.__next_scene is not None:
             # First, see if we should change the scene
@@ -156,7 +214,7 @@ class MainLoop:
                 # Transfer the next scene over
                 self.scene = self.__next_scene
                 self.__next_scene = None
-                self.__last_tick = time.time()
+                self.__last_tick = time.monotonic()
                 self.registered_components = []
 
                 # Set everything to empty if we are exiting (special sentinal)
@@ -176,9 +234,11 @@ class MainLoop:
                 self.__dirty = True
 
             # Now, tick the scene
-            now = time.time()
-            if now - self.__last_tick > self.TICK_DELTA:
-                num_ticks = int((now - self.__last_tick) / self.TICK_DELTA)
+            now = time.monotonic()
+            if now - self.__last_tick > tick_delta:
+                # Don't try to catch up on ticks lost to a long stall (such as being
+                # suspended), since that would only block input for even longer.
+                num_ticks = min(int((now - self.__last_tick) / tick_delta), max_ticks)
                 self.__last_tick = now
                 for _ in range(num_ticks):
                     if self.scene:
@@ -188,145 +248,196 @@ class MainLoop:
                     for (component, _, _) in self.registered_components:
                         component.tick()
 
-            # Now, see about drawing the scene
-            if (
-                self.__dirty
-                or any(component.dirty for component in self.components)
-                or any(
-                    component.dirty for (component, _, _) in self.registered_components
-                )
+            # Now, see about drawing the scene. In realtime mode, changes that come
+            # from ticks or other threads are batched up to the frame rate, but new
+            # scenes, resizes and input are always drawn right away.
+            if self.__needs_render() and (
+                not self.__realtime
+                or self.__dirty
+                or handled_events
+                or now - last_render >= frame_delta
             ):
-                if on_windows or self.__dirty:
+                last_render = now
+                context = self.context
+                if _ON_WINDOWS or self.__dirty:
                     # Only clear when we resize or paint a new scene. Otherwise just refresh.
-                    self.context.clear()
+                    context.clear()
+                bounds = context.bounds
                 for component in self.components:
-                    component._render(self.context, self.context.bounds)
+                    component._render(context, bounds)
                 # Render these last, because they depend on their parent being rendered to know where to go.
                 # Also, these are used for floating menus and dialogs, so they must be last.
                 for (component, location, parent) in self.registered_components:
-                    if parent is None:
-                        parentlocation = self.context.bounds
-                    else:
-                        parentlocation = (
-                            parent.location
-                            if parent.location is not None
-                            else self.context.bounds
-                        )
+                    parentlocation = parent.location if parent is not None else None
+                    if parentlocation is None:
+                        parentlocation = bounds
                     if location is None:
-                        location = self.context.bounds
+                        location = bounds
                     component._render(
-                        self.context,
+                        context,
                         location.offset(parentlocation.top, parentlocation.left).clip(
-                            self.context.bounds
+                            bounds
                         ),
                     )
-                self.context.refresh()
+                context.refresh()
             self.__dirty = False
 
             # Finally, handle input to the scene, then to the components
-            event: Optional[InputEvent] = None
-            if self.scene:
-                key = self.context.getkey()
-            else:
-                key = None
+            if self.scene and not self.__pending_events:
+                self.__read_events()
+
+            # Handle everything that came in together before drawing again, unless
+            # one of the events changes what is on screen enough that later input
+            # needs to see it rendered first.
+            handled_events = False
+            while (
+                self.__pending_events and self.__next_scene is None and not self.__dirty
+            ):
+                self.__handle_event(self.__pending_events.popleft())
+                handled_events = True
 
-            if key is not None:
-                if key == "KEY_RESIZE":
+            if self.scene and not handled_events and not self.__dirty:
+                # Call the idle timeout function so main application can do work
+                if self.__idle is not None:
+                    self.__idle(self)
+
+    def __needs_render(self) -> bool:
+        # Components work out their own dirty state so we have to ask each of them,
+        # but we can stop asking as soon as any one of them needs a redraw.
+        if self.__dirty:
+            return True
+        for component in self.components:
+            if component.dirty:
+                return True
+        for (component, _, _) in self.registered_components:
+            if component.dirty:
+                return True
+        return False
+
+    def __read_events(self) -> None:
+        # Wait for the next key, then drain anything else that is already queued so
+        # a burst of input gets handled in one pass instead of one frame per key.
+        key = self.context.getkey()
+        if key is None:
+            return
+
+        # Everything drained below arrived together, so timestamp it all at once.
+        now = time.monotonic()
+
+        self.__curses_context.nodelay(1)
+        try:
+            while key is not None:
+                if key == _KEY_RESIZE:
                     # We assume that a refresh is effectively free, so we don't
                     # attempt to calculate how long to wait next time based on
-                    # forgetting to do this loop.
+                    # forgetting to do this loop. Any number of resizes in a row
+                    # only needs one repaint.
+                    self.context.invalidate_bounds()
                     self.__dirty = True
-                elif key == "KEY_MOUSE":
-                    try:
-                        _, x, y, _, mask = curses.getmouse()
-                        if mask == curses.BUTTON1_PRESSED:
-                            self.__mousestate[Buttons.LEFT] = ((x, y), time.time())
-                        elif mask == curses.BUTTON2_PRESSED:
-                            self.__mousestate[Buttons.MIDDLE] = ((x, y), time.time())
-                        elif mask == curses.BUTTON3_PRESSED:
-                            self.__mousestate[Buttons.RIGHT] = ((x, y), time.time())
-                        elif mask == curses.BUTTON4_PRESSED:
-                            event = ScrollInputEvent(x, y, Directions.UP)
-                        elif mask == curses.BUTTON1_RELEASED:
-                            if (
-                                self.__mousestate[Buttons.LEFT][0] == (x, y)
-                                and (time.time() - self.__mousestate[Buttons.LEFT][1])
-                                < 1.0
-                            ):
-                                event = MouseInputEvent(x, y, Buttons.LEFT)
-                        elif mask == curses.BUTTON2_RELEASED:
-                            if (
-                                self.__mousestate[Buttons.MIDDLE][0] == (x, y)
-                                and (time.time() - self.__mousestate[Buttons.MIDDLE][1])
-                                < 1.0
-                            ):
-                                event = MouseInputEvent(x, y, Buttons.MIDDLE)
-                        elif mask == curses.BUTTON3_RELEASED:
-                            if (
-                                self.__mousestate[Buttons.RIGHT][0] == (x, y)
-                                and (time.time() - self.__mousestate[Buttons.RIGHT][1])
-                                < 1.0
-                            ):
-                                event = MouseInputEvent(x, y, Buttons.RIGHT)
-                        elif mask == curses.REPORT_MOUSE_POSITION or mask == 0x200000:
-                            event = ScrollInputEvent(x, y, Directions.DOWN)
-                    except CursesError:
-                        pass
                 else:
-                    event = KeyboardInputEvent(key)
-
-                if event is not None:
-                    handled: bool = False
-                    deferred: List[DeferredInput] = []
-
-                    # First, handle registered components
-                    # Registered components are usually some sort of popover, so prioritize
-                    # newest (topmost) over oldest (bottommost).
-                    for (component, _, _) in reversed(self.registered_components):
-                        # Bail if we've already handled this input
-                        if handled:
-                            break
-                        _handled = component._handle_input(event)
-
-                        # If this control wants to be deferred, add it to the list
-                        # and then try the next control. Otherwise, handle the input
-                        # as normal.
-                        if isinstance(_handled, bool):
-                            handled = _handled
-                        else:
-                            deferred.append(_handled)
-
-                    # Now, handle standard drawn components
-                    for component in self.components:
-                        # Bail if we've already handled this input
-                        if handled:
-                            break
-                        _handled = component._handle_input(event)
-
-                        # If this control wants to be deferred, add it to the list
-                        # and then try the next control. Otherwise, handle the input
-                        # as normal.
-                        if isinstance(_handled, bool):
-                            handled = _handled
-                        else:
-                            deferred.append(_handled)
-
-                    # Now, call deferred components, prioritizing the first
-                    # one we find.
-                    if not handled and deferred:
-                        for callback in deferred:
-                            # Bail if we've already handled this inpuit
-                            if handled:
-                                break
-
-                            # Run the control's deferred input callback
-                            handled = callback()
-
-                    # Finally, handle scene-global input
-                    if not handled and self.scene is not None:
-                        handled = self.scene.handle_input(event)
-
-            if self.scene and event is None and not self.__dirty:
-                # Call the idle timeout function so main application can do work
-                if self.__idle is not None:
-                    self.__idle(self)
+                    event = self.__get_event(key, now)
+                    if event is not None:
+                        self.__queue_event(event)
+                key = self.context.getkey()
+        finally:
+            if self.__realtime:
+                self.__curses_context.timeout(int(self.INPUT_TIMEOUT * 1000))
+            else:
+                self.__curses_context.nodelay(0)
+
+    def __queue_event(self, event: InputEvent) -> None:
+        # Fast wheels and trackpads send a flood of scroll notches, so when asked to,
+        # merge a run of them in the same spot into one event instead of dispatching
+        # each notch. Handlers must then read the event's count to scroll the whole
+        # distance, which is why this is opt-in.
+        if (
+            self.__merge_scrolls
+            and isinstance(event, ScrollInputEvent)
+            and self.__pending_events
+        ):
+            last = self.__pending_events[-1]
+            if (
+                isinstance(last, ScrollInputEvent)
+                and last.direction == event.direction
+                and last.x == event.x
+                and last.y == event.y
+            ):
+                last.count += event.count
+                return
+        self.__pending_events.append(event)
+
+    def __get_event(self, key: str, now: float) -> Optional[InputEvent]:
+        event: Optional[InputEvent] = None
+        if key == _KEY_MOUSE:
+            try:
+                _, x, y, _, mask = curses.getmouse()
+                if mask in _MOUSE_PRESSES:
+                    self.__mousestate[_MOUSE_PRESSES[mask]] = ((x, y), now)
+                elif mask in _MOUSE_RELEASES:
+                    button = _MOUSE_RELEASES[mask]
+                    position, pressed = self.__mousestate[button]
+                    if position == (x, y) and (now - pressed) < 1.0:
+                        event = MouseInputEvent(x, y, button)
+                elif mask in _MOUSE_SCROLLS:
+                    event = ScrollInputEvent(x, y, _MOUSE_SCROLLS[mask])
+            except CursesError:
+                pass
+        else:
+            event = KeyboardInputEvent(key)
+        return event
+
+    def __handle_event(self, event: InputEvent) -> None:
+        handled: bool = False
+        # Reuse the same list for every event, since most events never defer.
+        deferred = self.__deferred
+        deferred.clear()
+
+        # First, handle registered components
+        # Registered components are usually some sort of popover, so prioritize
+        # newest (topmost) over oldest (bottommost).
+        for (component, _, _) in reversed(self.registered_components):
+            # Bail if we've already handled this input
+            if handled:
+                break
+            _handled = component._handle_input(event)
+
+            # If this control wants to be deferred, add it to the list
+            # and then try the next control. Otherwise, handle the input
+            # as normal.
+            if isinstance(_handled, bool):
+                handled = _handled
+            else:
+                deferred.append(_handled)
+
+        # Now, handle standard drawn components
+        for component in self.components:
+            # Bail if we've already handled this input
+            if handled:
+                break
+            _handled = component._handle_input(event)
+
+            # If this control wants to be deferred, add it to the list
+            # and then try the next control. Otherwise, handle the input
+            # as normal.
+            if isinstance(_handled, bool):
+                handled = _handled
+            else:
+                deferred.append(_handled)
+
+        # Now, call deferred components, prioritizing the first
+        # one we find.
+        if not handled and deferred:
+            for callback in deferred:
+                # Bail if we've already handled this inpuit
+                if handled:
+                    break
+
+                # Run the control's deferred input callback
+                handled = callback()
+
+        # Don't keep the callbacks (and the components they reference) alive.
+        deferred.clear()
+
+        # Finally, handle scene-global input
+        if not handled and self.scene is not None:
+            handled = self.scene.handle_input(event)
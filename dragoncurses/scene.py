@@ -9,6 +9,9 @@ if TYPE_CHECKING:
 ComponentT = TypeVar("ComponentT", bound="Component")
 SettingT = TypeVar("SettingT")
 
+# Stands in for a missing key, since None can be a legitimately stored value.
+_MISSING: Any = object()
+
 
 class Scene:
     def __init__(self, main_loop: "MainLoop", settings: Dict[str, Any]) -> None:
@@ -42,9 +45,9 @@ class Scene:
     def get_reference(
         self, name: str, expected_type: Type["ComponentT"]
     ) -> "ComponentT":
-        if name not in self.__stored_components:
+        component = self.__stored_components.get(name, _MISSING)
+        if component is _MISSING:
             raise Exception("Invalid component reference {}".format(name))
-        component = self.__stored_components[name]
         if not isinstance(component, expected_type):
             raise Exception("Invalid component reference {}".format(name))
         return component
@@ -59,11 +62,11 @@ class Scene:
         expected_type: Type["SettingT"],
         default: Optional["SettingT"] = None,
     ) -> "SettingT":
-        if name not in self.settings:
+        setting = self.settings.get(name, _MISSING)
+        if setting is _MISSING:
             if default is not None:
                 return default
             raise Exception("Invalid setting {}".format(name))
-        setting = self.settings[name]
         if not isinstance(setting, expected_type):
             raise Exception("Invalid setting {}".format(name))
         return setting
@@ -71,16 +74,15 @@ class Scene:
     def get_optional_setting(
         self, name: str, expected_type: Type["SettingT"]
     ) -> Optional["SettingT"]:
-        if name not in self.settings:
+        setting = self.settings.get(name, _MISSING)
+        if setting is _MISSING:
             return None
-        setting = self.settings[name]
         if not isinstance(setting, expected_type):
             raise Exception("Invalid setting {}".format(name))
         return setting
 
     def del_setting(self, name: str) -> None:
-        if name in self.settings:
-            del self.settings[name]
+        self.settings.pop(name, None)
 
     def tick(self) -> None:
         pass
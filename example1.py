@@ -1,9 +1,8 @@
-import argparse
 import sys
 import time
 
-from threading import Thread
-from typing import List, Optional, Union, Any
+from threading import Event, Thread
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
 from dragoncurses.component import (
     Component,
@@ -37,14 +36,260 @@ from dragoncurses.settings import Settings
 Settings.enable_unicode = True
 
 
-clock = None
-counter = None
+_PICTURE = (
+    (False, False, True, False, False),
+    (False, True, True, True, False),
+    (True, True, False, True, True),
+    (False, True, True, True, False),
+    (False, False, True, False, False),
+)
+_COLORPICTURE = (
+    (
+        Color.BLACK,
+        Color.BLACK,
+        Color.BLACK,
+        Color.WHITE,
+        Color.WHITE,
+        Color.WHITE,
+        Color.WHITE,
+        Color.WHITE,
+        Color.BLACK,
+        Color.BLACK,
+        Color.BLACK,
+        Color.BLACK,
+    ),
+    (
+        Color.BLACK,
+        Color.BLACK,
+        Color.WHITE,
+        Color.YELLOW,
+        Color.YELLOW,
+        Color.YELLOW,
+        Color.YELLOW,
+        Color.YELLOW,
+        Color.WHITE,
+        Color.BLACK,
+        Color.BLACK,
+        Color.BLACK,
+    ),
+    (
+        Color.BLACK,
+        Color.WHITE,
+        Color.YELLOW,
+        Color.BLUE,
+        Color.YELLOW,
+        Color.YELLOW,
+        Color.YELLOW,
+        Color.BLUE,
+        Color.YELLOW,
+        Color.WHITE,
+        Color.BLACK,
+        Color.BLACK,
+    ),
+    (
+        Color.WHITE,
+        Color.YELLOW,
+        Color.YELLOW,
+        Color.YELLOW,
+        Color.YELLOW,
+        Color.YELLOW,
+        Color.YELLOW,
+        Color.YELLOW,
+        Color.YELLOW,
+        Color.YELLOW,
+        Color.WHITE,
+        Color.BLACK,
+    ),
+    (
+        Color.WHITE,
+        Color.YELLOW,
+        Color.YELLOW,
+        Color.YELLOW,
+        Color.YELLOW,
+        Color.YELLOW,
+        Color.YELLOW,
+        Color.YELLOW,
+        Color.YELLOW,
+        Color.YELLOW,
+        Color.WHITE,
+        Color.BLACK,
+    ),
+    (
+        Color.WHITE,
+        Color.YELLOW,
+        Color.YELLOW,
+        Color.RED,
+        Color.YELLOW,
+        Color.YELLOW,
+        Color.YELLOW,
+        Color.RED,
+        Color.YELLOW,
+        Color.YELLOW,
+        Color.WHITE,
+        Color.BLACK,
+    ),
+    (
+        Color.BLACK,
+        Color.WHITE,
+        Color.YELLOW,
+        Color.YELLOW,
+        Color.RED,
+        Color.RED,
+        Color.RED,
+        Color.YELLOW,
+        Color.YELLOW,
+        Color.WHITE,
+        Color.BLACK,
+        Color.BLACK,
+    ),
+    (
+        Color.BLACK,
+        Color.BLACK,
+        Color.WHITE,
+        Color.YELLOW,
+        Color.YELLOW,
+        Color.YELLOW,
+        Color.YELLOW,
+        Color.YELLOW,
+        Color.WHITE,
+        Color.BLACK,
+        Color.BLACK,
+        Color.BLACK,
+    ),
+    (
+        Color.BLACK,
+        Color.BLACK,
+        Color.BLACK,
+        Color.WHITE,
+        Color.WHITE,
+        Color.WHITE,
+        Color.WHITE,
+        Color.WHITE,
+        Color.BLACK,
+        Color.BLACK,
+        Color.BLACK,
+        Color.BLACK,
+    ),
+    (
+        Color.BLACK,
+        Color.BLACK,
+        Color.BLACK,
+        Color.BLACK,
+        Color.BLACK,
+        Color.BLACK,
+        Color.BLACK,
+        Color.BLACK,
+        Color.BLACK,
+        Color.BLACK,
+        Color.BLACK,
+        Color.BLACK,
+    ),
+)
+
+
+# Formatted labels are parsed once per distinct string, so reuse the same text.
+_RAINBOW = "<red>r</red><yellow>a</yellow><green>i</green><cyan>n</cyan><blue>b</blue><magenta>o</magenta>w"
+_INVERTED_RAINBOW = "<invert>{}</invert>".format(_RAINBOW)
+
+# What the example button says and what color it turns depending on how it was
+# pressed.
+_BUTTON_TEXTS = {
+    button: "A <underline>b</underline>utton (pressed {}!)".format(button.name)
+    for button in Buttons
+}
+_BUTTON_COLORS = {
+    Buttons.LEFT: Color.RED,
+    Buttons.RIGHT: Color.CYAN,
+}
+
+# The popover menu in the test scene. Each entry names the button attribute it
+# changes and the value to change it to, or holds a submenu.
+_MENU: List[Tuple[str, Any]] = [
+    (
+        "Set &Text",
+        [
+            ("&Default", ("text", "A popover <underline>m</underline>enu")),
+            (
+                "&Others",
+                [
+                    ("Option &1", ("text", "A better <underline>m</underline>enu")),
+                    ("Option &2", ("text", "A great <underline>m</underline>enu")),
+                ],
+            ),
+            (
+                "Testing",
+                [
+                    ("Option &3", ("text", "A bad <underline>m</underline>enu")),
+                    ("Option &4", ("text", "A worse <underline>m</underline>enu")),
+                ],
+            ),
+        ],
+    ),
+    ("-", None),
+    ("Set &Red", ("textcolor", Color.RED)),
+    ("Set &Yellow", ("textcolor", Color.YELLOW)),
+    ("Set &Green", ("textcolor", Color.GREEN)),
+    ("Set &Blue", ("textcolor", Color.BLUE)),
+    ("Set &Purple", ("textcolor", Color.MAGENTA)),
+    ("-", None),
+    (
+        "Set Border",
+        [
+            ("Regular", ("bordercolor", Color.NONE)),
+            ("Cyan", ("bordercolor", Color.CYAN)),
+        ],
+    ),
+]
+
+
+def _get_menu_actions(menu: List[Tuple[str, Any]]) -> Dict[str, Tuple[str, Any]]:
+    actions: Dict[str, Tuple[str, Any]] = {}
+    for option, action in menu:
+        if isinstance(action, list):
+            actions.update(_get_menu_actions(action))
+        elif action is not None:
+            actions[option] = action
+    return actions
+
+
+def _bind_menu(
+    menu: List[Tuple[str, Any]], callback: Callable[[Component, str], None]
+) -> List[Tuple[str, Any]]:
+    # Every entry shares the one callback, which looks its action up by option.
+    return [
+        (
+            option,
+            _bind_menu(action, callback)
+            if isinstance(action, list)
+            else (None if action is None else callback),
+        )
+        for option, action in menu
+    ]
+
+
+_MENU_ACTIONS = _get_menu_actions(_MENU)
+
+
+def _highlight(text: str, pos: int) -> str:
+    return "{}<invert>{}</invert>{}".format(text[:pos], text[pos], text[pos + 1 :])
+
+
+# Each step of the hello world animation highlights one character, counting down
+# from the last one. The first step is off the left edge, so it has no highlight.
+_HELLO = "Hello, world!"
+_HELLO_FRAMES: Tuple[str, ...] = tuple(
+    _highlight(_HELLO, pos) for pos in range(len(_HELLO))
+)
+
+last_time = -1
+last_time_str = ""
 
 
 class HelloWorldComponent(Component):
     def __init__(self) -> None:
         super().__init__()
         self.animation = 0  # type: Optional[int]
+        self.__rendered_animation = -1  # type: Optional[int]
 
     def tick(self) -> None:
         animation = self.animation
@@ -54,18 +299,21 @@ class HelloWorldComponent(Component):
             self.animation = None
 
     def render(self, context: RenderContext) -> None:
-        text = "Hello, world!"
-
         animation = self.animation
-        if animation is None or animation == 0:
-            context.draw_string(0, 0, text)
+        self.__rendered_animation = animation
+        pos = len(_HELLO) - animation if animation is not None else -1
+        if 0 <= pos < len(_HELLO):
+            # Draw the highlighted character along with the rest of the text in one
+            # pass instead of drawing over the top of it afterwards.
+            context.draw_formatted_string(0, 0, _HELLO_FRAMES[pos])
         else:
-            context.draw_string(0, 0, text)
-            context.draw_string(0, 13 - animation, text[13 - animation], invert=True)
+            context.draw_string(0, 0, _HELLO)
 
     @property
     def dirty(self) -> bool:
-        return self.animation is not None
+        # Only the ticks move the animation along, so there's nothing new to draw
+        # until one of them has happened.
+        return self.animation != self.__rendered_animation
 
     def handle_input(self, event: InputEvent) -> bool:
         if isinstance(event, KeyboardInputEvent):
@@ -78,7 +326,7 @@ class HelloWorldComponent(Component):
 class ScrollTestComponent(Component):
     def __init__(self, global_capture: bool = True) -> None:
         super().__init__()
-        self.__rendered = False
+        self.__shown_count: Optional[int] = None
         self.__count = 0
         self.__global_capture = global_capture
 
@@ -88,20 +336,15 @@ class ScrollTestComponent(Component):
             0, 0, "Scroll {}!".format("anywhere" if self.__global_capture else "me")
         )
         context.draw_string(1, 0, str(self.__count))
-        self.__rendered = True
+        self.__shown_count = self.__count
 
     @property
     def dirty(self) -> bool:
-        return not self.__rendered
+        # Scrolling back and forth between renders can leave nothing to redraw.
+        return self.__shown_count != self.__count
 
-    def _deferred_scroll_up(self) -> bool:
-        self.__count -= 1
-        self.__rendered = False
-        return True
-
-    def _deferred_scroll_down(self) -> bool:
-        self.__count += 1
-        self.__rendered = False
+    def _scroll(self, amount: int) -> bool:
+        self.__count += amount
         return True
 
     def handle_input(self, event: InputEvent) -> Union[bool, DeferredInput]:
@@ -113,20 +356,25 @@ class ScrollTestComponent(Component):
                     if not self.location.contains(event.y, event.x):
                         return False
                 if event.direction == Directions.UP:
-                    return self._deferred_scroll_up()
+                    return self._scroll(-event.count)
                 if event.direction == Directions.DOWN:
-                    return self._deferred_scroll_down()
+                    return self._scroll(event.count)
             else:
                 # If we are doing global scroll, capture only if
                 # we haven't handled the event elsewhere.
+                count = event.count
                 if event.direction == Directions.UP:
-                    return self._deferred_scroll_up
+                    return lambda: self._scroll(-count)
                 if event.direction == Directions.DOWN:
-                    return self._deferred_scroll_down
+                    return lambda: self._scroll(count)
 
         return False
 
 
+_RENDERED_ONCE = "Rendered 1 time!"
+_RENDERED_MANY = "Rendered {} times!"
+
+
 class RenderCounterComponent(Component):
     def __init__(self) -> None:
         super().__init__()
@@ -139,9 +387,9 @@ class RenderCounterComponent(Component):
         context.draw_string(
             0,
             0,
-            "Rendered {} time{}!".format(
-                self.__count, ("" if self.__count == 1 else "s")
-            ),
+            _RENDERED_ONCE
+            if self.__count == 1
+            else _RENDERED_MANY.format(self.__count),
             wrap=True,
         )
         self.__rendered = True
@@ -151,177 +399,54 @@ class RenderCounterComponent(Component):
         return not self.__rendered
 
 
-class WelcomeScene(Scene):
+class ExampleScene(Scene):
+    def __init__(self, main_loop: MainLoop, settings: Dict[str, Any]) -> None:
+        super().__init__(main_loop, settings)
+        self.__key_handlers: Dict[str, Callable[[], bool]] = {
+            Keys.ESCAPE: self.confirm_exit,
+            "q": self.confirm_exit,
+            Keys.ENTER: self.next_scene,
+        }
+        # The exit dialog callbacks only depend on us, so make them once.
+        self.__exit_options: Tuple[Tuple[str, Callable[[Component, str], Any]], ...] = (
+            ("&Yes", lambda component, option: self.main_loop.exit()),
+            ("&No", lambda component, option: self.unregister_component(component)),
+        )
+
+    def confirm_exit(self) -> bool:
+        self.register_component(
+            DialogBoxComponent(
+                "Are you sure you want to exit?",
+                self.__exit_options,
+                escape_option="&No",
+            )
+        )
+        return True
+
+    def next_scene(self) -> bool:
+        return False
+
+    def handle_input(self, event: InputEvent) -> bool:
+        if isinstance(event, KeyboardInputEvent):
+            handler = self.__key_handlers.get(event.character)
+            if handler is not None:
+                return handler()
+        return False
+
+
+class WelcomeScene(ExampleScene):
     def update_button(self, component: Component, button: Buttons) -> bool:
         if isinstance(component, ButtonComponent):
-            component.text = "A <underline>b</underline>utton (pressed {}!)".format(
-                button.name
-            )
-            component.textcolor = (
-                Color.RED
-                if button == Buttons.LEFT
-                else Color.CYAN
-                if button == Buttons.RIGHT
-                else Color.YELLOW
-            )
+            component.text = _BUTTON_TEXTS[button]
+            component.textcolor = _BUTTON_COLORS.get(button, Color.YELLOW)
         return True
 
     def create(self) -> Component:
-        global clock
-        global counter
-
-        picture = [
-            [False, False, True, False, False],
-            [False, True, True, True, False],
-            [True, True, False, True, True],
-            [False, True, True, True, False],
-            [False, False, True, False, False],
-        ]
-        colorpicture = [
-            [
-                Color.BLACK,
-                Color.BLACK,
-                Color.BLACK,
-                Color.WHITE,
-                Color.WHITE,
-                Color.WHITE,
-                Color.WHITE,
-                Color.WHITE,
-                Color.BLACK,
-                Color.BLACK,
-                Color.BLACK,
-                Color.BLACK,
-            ],
-            [
-                Color.BLACK,
-                Color.BLACK,
-                Color.WHITE,
-                Color.YELLOW,
-                Color.YELLOW,
-                Color.YELLOW,
-                Color.YELLOW,
-                Color.YELLOW,
-                Color.WHITE,
-                Color.BLACK,
-                Color.BLACK,
-                Color.BLACK,
-            ],
-            [
-                Color.BLACK,
-                Color.WHITE,
-                Color.YELLOW,
-                Color.BLUE,
-                Color.YELLOW,
-                Color.YELLOW,
-                Color.YELLOW,
-                Color.BLUE,
-                Color.YELLOW,
-                Color.WHITE,
-                Color.BLACK,
-                Color.BLACK,
-            ],
-            [
-                Color.WHITE,
-                Color.YELLOW,
-                Color.YELLOW,
-                Color.YELLOW,
-                Color.YELLOW,
-                Color.YELLOW,
-                Color.YELLOW,
-                Color.YELLOW,
-                Color.YELLOW,
-                Color.YELLOW,
-                Color.WHITE,
-                Color.BLACK,
-            ],
-            [
-                Color.WHITE,
-                Color.YELLOW,
-                Color.YELLOW,
-                Color.YELLOW,
-                Color.YELLOW,
-                Color.YELLOW,
-                Color.YELLOW,
-                Color.YELLOW,
-                Color.YELLOW,
-                Color.YELLOW,
-                Color.WHITE,
-                Color.BLACK,
-            ],
-            [
-                Color.WHITE,
-                Color.YELLOW,
-                Color.YELLOW,
-                Color.RED,
-                Color.YELLOW,
-                Color.YELLOW,
-                Color.YELLOW,
-                Color.RED,
-                Color.YELLOW,
-                Color.YELLOW,
-                Color.WHITE,
-                Color.BLACK,
-            ],
-            [
-                Color.BLACK,
-                Color.WHITE,
-                Color.YELLOW,
-                Color.YELLOW,
-                Color.RED,
-                Color.RED,
-                Color.RED,
-                Color.YELLOW,
-                Color.YELLOW,
-                Color.WHITE,
-                Color.BLACK,
-                Color.BLACK,
-            ],
-            [
-                Color.BLACK,
-                Color.BLACK,
-                Color.WHITE,
-                Color.YELLOW,
-                Color.YELLOW,
-                Color.YELLOW,
-                Color.YELLOW,
-                Color.YELLOW,
-                Color.WHITE,
-                Color.BLACK,
-                Color.BLACK,
-                Color.BLACK,
-            ],
-            [
-                Color.BLACK,
-                Color.BLACK,
-                Color.BLACK,
-                Color.WHITE,
-                Color.WHITE,
-                Color.WHITE,
-                Color.WHITE,
-                Color.WHITE,
-                Color.BLACK,
-                Color.BLACK,
-                Color.BLACK,
-                Color.BLACK,
-            ],
-            [
-                Color.BLACK,
-                Color.BLACK,
-                Color.BLACK,
-                Color.BLACK,
-                Color.BLACK,
-                Color.BLACK,
-                Color.BLACK,
-                Color.BLACK,
-                Color.BLACK,
-                Color.BLACK,
-                Color.BLACK,
-                Color.BLACK,
-            ],
-        ]
+        unicode = Settings.enable_unicode
 
-        clock = LabelComponent(get_current_time())
-        counter = LabelComponent("Threads aren't working!")
+        # The idle callback and the counter thread find these through the settings.
+        clock = self.put_setting("clock", LabelComponent(get_current_time()))
+        counter = self.put_setting("counter", LabelComponent("Threads aren't working!"))
         return StickyComponent(
             StickyComponent(
                 clock,
@@ -338,31 +463,18 @@ class WelcomeScene(Scene):
                             ButtonComponent(
                                 "A <underline>b</underline>utton (not pressed)",
                                 formatted=True,
-                            )
-                            .on_click(self.update_button)
-                            .set_hotkey("b"),
+                                on_click=self.update_button,
+                                hotkey="b",
+                            ),
                             ListComponent(
                                 [
                                     LabelComponent(
                                         "Testing <underline>1</underline>, <invert>2</invert>, 3!",
                                         formatted=True,
                                     ),
-                                    LabelComponent(
-                                        "<red>r</red><yellow>a</yellow><green>i</green><cyan>n</cyan><blue>b</blue><magenta>o</magenta>w",
-                                        formatted=True,
-                                    ),
-                                    LabelComponent(
-                                        "<red>r</red><yellow>a</yellow><green>i</green><cyan>n</cyan><blue>b</blue><magenta>o</magenta>w"
-                                        "<red>r</red><yellow>a</yellow><green>i</green><cyan>n</cyan><blue>b</blue><magenta>o</magenta>w"
-                                        "<red>r</red><yellow>a</yellow><green>i</green><cyan>n</cyan><blue>b</blue><magenta>o</magenta>w"
-                                        "<red>r</red><yellow>a</yellow><green>i</green><cyan>n</cyan><blue>b</blue><magenta>o</magenta>w"
-                                        "<red>r</red><yellow>a</yellow><green>i</green><cyan>n</cyan><blue>b</blue><magenta>o</magenta>w",
-                                        formatted=True,
-                                    ),
-                                    LabelComponent(
-                                        "<invert><red>r</red><yellow>a</yellow><green>i</green><cyan>n</cyan><blue>b</blue><magenta>o</magenta>w</invert>",
-                                        formatted=True,
-                                    ),
+                                    LabelComponent(_RAINBOW, formatted=True),
+                                    LabelComponent(_RAINBOW * 5, formatted=True),
+                                    LabelComponent(_INVERTED_RAINBOW, formatted=True),
                                 ],
                                 direction=ListComponent.DIRECTION_TOP_TO_BOTTOM,
                                 size=1,
@@ -383,7 +495,7 @@ class WelcomeScene(Scene):
                         [
                             PaddingComponent(
                                 MonochromePictureComponent(
-                                    picture,
+                                    _PICTURE,
                                     size=MonochromePictureComponent.SIZE_FULL,
                                     forecolor=Color.CYAN,
                                     backcolor=Color.BLUE,
@@ -392,14 +504,14 @@ class WelcomeScene(Scene):
                             ),
                             PaddingComponent(
                                 MonochromePictureComponent(
-                                    picture,
+                                    _PICTURE,
                                     size=MonochromePictureComponent.SIZE_HALF,
                                     forecolor=Color.MAGENTA,
                                     backcolor=Color.WHITE,
                                 ),
                                 padding=2,
                             )
-                            if Settings.enable_unicode
+                            if unicode
                             else EmptyComponent(),
                         ],
                         direction=ListComponent.DIRECTION_TOP_TO_BOTTOM,
@@ -408,19 +520,19 @@ class WelcomeScene(Scene):
                         [
                             PaddingComponent(
                                 PictureComponent(
-                                    colorpicture,
+                                    _COLORPICTURE,
                                     size=PictureComponent.SIZE_FULL,
                                 ),
                                 padding=2,
                             ),
                             PaddingComponent(
                                 PictureComponent(
-                                    colorpicture,
+                                    _COLORPICTURE,
                                     size=PictureComponent.SIZE_HALF,
                                 ),
                                 padding=2,
                             )
-                            if Settings.enable_unicode
+                            if unicode
                             else EmptyComponent(),
                         ],
                         direction=ListComponent.DIRECTION_TOP_TO_BOTTOM,
@@ -448,111 +560,22 @@ class WelcomeScene(Scene):
             size=1,
         )
 
-    def handle_input(self, event: InputEvent) -> bool:
-        if isinstance(event, KeyboardInputEvent):
-            if event.character in [Keys.ESCAPE, "q"]:
-                self.register_component(
-                    DialogBoxComponent(
-                        "Are you sure you want to exit?",
-                        [
-                            ("&Yes", lambda component, option: self.main_loop.exit()),
-                            (
-                                "&No",
-                                lambda component, option: self.unregister_component(
-                                    component
-                                ),
-                            ),
-                        ],
-                        escape_option="&No",
-                    )
-                )
-
-                return True
-            if event.character == Keys.ENTER:
-                self.main_loop.change_scene(TestScene)
-                return True
-        return False
+    def next_scene(self) -> bool:
+        self.main_loop.change_scene(TestScene)
+        return True
 
 
-class TestScene(Scene):
+class TestScene(ExampleScene):
     def pop_menu(self, component: Component, button: Buttons) -> bool:
         if not isinstance(component, ButtonComponent):
             raise Exception("Logic error, somehow got callback with wrong component?")
         localcomponent: ButtonComponent = component
 
-        def text(text: str) -> None:
-            localcomponent.text = text
-
-        def color(color: Color) -> None:
-            localcomponent.textcolor = color
+        def apply(menu: Component, option: str) -> None:
+            attribute, value = _MENU_ACTIONS[option]
+            setattr(localcomponent, attribute, value)
 
-        def border(color: Color) -> None:
-            localcomponent.bordercolor = color
-
-        menu = PopoverMenuComponent(
-            [
-                (
-                    "Set &Text",
-                    [
-                        (
-                            "&Default",
-                            lambda menuentry, option: text(
-                                "A popover <underline>m</underline>enu"
-                            ),
-                        ),
-                        (
-                            "&Others",
-                            [
-                                (
-                                    "Option &1",
-                                    lambda menuentry, option: text(
-                                        "A better <underline>m</underline>enu"
-                                    ),
-                                ),
-                                (
-                                    "Option &2",
-                                    lambda menuentry, option: text(
-                                        "A great <underline>m</underline>enu"
-                                    ),
-                                ),
-                            ],
-                        ),
-                        (
-                            "Testing",
-                            [
-                                (
-                                    "Option &3",
-                                    lambda menuentry, option: text(
-                                        "A bad <underline>m</underline>enu"
-                                    ),
-                                ),
-                                (
-                                    "Option &4",
-                                    lambda menuentry, option: text(
-                                        "A worse <underline>m</underline>enu"
-                                    ),
-                                ),
-                            ],
-                        ),
-                    ],
-                ),
-                ("-", None),
-                ("Set &Red", lambda menuentry, option: color(Color.RED)),
-                ("Set &Yellow", lambda menuentry, option: color(Color.YELLOW)),
-                ("Set &Green", lambda menuentry, option: color(Color.GREEN)),
-                ("Set &Blue", lambda menuentry, option: color(Color.BLUE)),
-                ("Set &Purple", lambda menuentry, option: color(Color.MAGENTA)),
-                ("-", None),
-                (
-                    "Set Border",
-                    [
-                        ("Regular", lambda menuentry, option: border(Color.NONE)),
-                        ("Cyan", lambda menuentry, option: border(Color.CYAN)),
-                    ],
-                ),
-            ],
-            animated=True,
-        )
+        menu = PopoverMenuComponent(_bind_menu(_MENU, apply), animated=True)
         localcomponent.register(
             menu,
             menu.bounds.offset(3, 0),
@@ -560,6 +583,8 @@ class TestScene(Scene):
         return True
 
     def create(self) -> Component:
+        unicode = Settings.enable_unicode
+
         return ListComponent(
             [
                 ListComponent(
@@ -572,9 +597,9 @@ class TestScene(Scene):
                                     "A popover <underline>m</underline>enu",
                                     textcolor=Color.MAGENTA,
                                     formatted=True,
-                                )
-                                .on_click(self.pop_menu)
-                                .set_hotkey("m"),
+                                    on_click=self.pop_menu,
+                                    hotkey="m",
+                                ),
                             ],
                             direction=ListComponent.DIRECTION_TOP_TO_BOTTOM,
                             size=3,
@@ -584,9 +609,13 @@ class TestScene(Scene):
                     direction=ListComponent.DIRECTION_LEFT_TO_RIGHT,
                 ),
                 LabelComponent(
-                    "This is a label with a lot of stuff that should word-wrap!\n"
-                    + "I've placed a few tabs and stuff here so we know it works!\n"
-                    + "What about some tabs? Let's do some tab-related activities~"
+                    "\n".join(
+                        (
+                            "This is a label with a lot of stuff that should word-wrap!",
+                            "I've placed a few tabs and stuff here so we know it works!",
+                            "What about some tabs? Let's do some tab-related activities~",
+                        )
+                    )
                 ),
                 PaddingComponent(
                     BorderComponent(
@@ -604,20 +633,24 @@ class TestScene(Scene):
                         BorderComponent(
                             LabelComponent("Label 4!"), style=BorderComponent.SINGLE
                         )
-                        if Settings.enable_unicode
+                        if unicode
                         else EmptyComponent(),
                         BorderComponent(
                             LabelComponent("Label 5!"), style=BorderComponent.DOUBLE
                         )
-                        if Settings.enable_unicode
+                        if unicode
                         else EmptyComponent(),
                     ],
                     direction=ListComponent.DIRECTION_LEFT_TO_RIGHT,
                 ),
                 LabelComponent(
-                    "This is a <underline>label</underline> with a <invert>lot</invert> of stuff that should word-wrap!\n"
-                    + "I've placed a <invert>few <green>tabs</green></invert> and stuff here so we know it works!\n"
-                    + "What about some tabs? Let's do some <red>tab-related</red> activities~",
+                    "\n".join(
+                        (
+                            "This is a <underline>label</underline> with a <invert>lot</invert> of stuff that should word-wrap!",
+                            "I've placed a <invert>few <green>tabs</green></invert> and stuff here so we know it works!",
+                            "What about some tabs? Let's do some <red>tab-related</red> activities~",
+                        )
+                    ),
                     formatted=True,
                 ),
                 RenderCounterComponent(),
@@ -625,65 +658,67 @@ class TestScene(Scene):
             direction=ListComponent.DIRECTION_TOP_TO_BOTTOM,
         )
 
-    def handle_input(self, event: InputEvent) -> bool:
-        if isinstance(event, KeyboardInputEvent):
-            if event.character in [Keys.ESCAPE, "q"]:
-                self.register_component(
-                    DialogBoxComponent(
-                        "Are you sure you want to exit?",
-                        [
-                            ("&Yes", lambda component, option: self.main_loop.exit()),
-                            (
-                                "&No",
-                                lambda component, option: self.unregister_component(
-                                    component
-                                ),
-                            ),
-                        ],
-                        escape_option="&No",
-                    )
-                )
-
-                return True
-            if event.character == Keys.ENTER:
-                self.main_loop.change_scene(WelcomeScene)
-                return True
-        return False
+    def next_scene(self) -> bool:
+        self.main_loop.change_scene(WelcomeScene)
+        return True
 
 
 def get_current_time() -> str:
-    return time.strftime("%Y-%m-%d %H:%M:%S")
+    global last_time
+    global last_time_str
 
+    # The clock only shows seconds, so only format it when the second changes.
+    now = int(time.time())
+    if now != last_time:
+        last_time = now
+        last_time_str = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(now))
+    return last_time_str
 
-def idle(mainloop: MainLoop) -> None:
-    global clock
 
-    if clock is not None:
-        clock.text = get_current_time()
+def idle(mainloop: MainLoop) -> None:
+    clock = mainloop.settings.get("clock")
+    if isinstance(clock, LabelComponent):
+        current = get_current_time()
+        if clock.text != current:
+            clock.text = current
 
 
-def thread(exit: List[Any]) -> None:
-    global counter
+def thread(exit: Event, settings: Dict[str, Any]) -> None:
     val = 0
 
-    while len(exit) == 0:
-        if counter is not None:
+    # Waiting on the exit event both paces the counter and lets us stop right away.
+    while not exit.wait(0.05):
+        counter = settings.get("counter")
+        if isinstance(counter, LabelComponent):
             counter.text = "Threading works!\nCounter is {}".format(val)
             val += 1
 
 
 def main() -> int:
-    parser = argparse.ArgumentParser(description="A simple curses UI library.")
-    parser.parse_args()
+    # We take no options, so only pay for argparse when there is something to
+    # parse, such as --help or a stray argument that should be rejected.
+    if len(sys.argv) > 1:
+        import argparse
 
-    exitthread: List[str] = []
-    t = Thread(target=thread, args=(exitthread,))
+        parser = argparse.ArgumentParser(description="A simple curses UI library.")
+        parser.parse_args()
+
+    settings: Dict[str, Any] = {}
+    exitthread = Event()
+    t = Thread(target=thread, args=(exitthread, settings))
     t.start()
 
     # Run the main program loop, starting with the welcome scene
-    execute(WelcomeScene, idle_callback=idle, realtime=True)
-
-    exitthread.append("exit")
+    execute(
+        WelcomeScene,
+        settings=settings,
+        idle_callback=idle,
+        realtime=True,
+        merge_scrolls=True,
+    )
+
+    exitthread.set()
+    t.join()
 
     return 0
 